@@ -4,6 +4,8 @@ import sys
 from pathlib import Path
 
 from dynatrace_rule_helper.engine.core import process_log_file
+from dynatrace_rule_helper.engine.rule_library import RuleLibrary
+from dynatrace_rule_helper.utils.file_io import read_json
 
 def parse_arguments():
     parser = argparse.ArgumentParser(
@@ -18,8 +20,17 @@ def parse_arguments():
                         help="Comma‑separated matcher type(s) (INT, FLOAT, STRING, ENUM, REGEX, ...). Optional – inferred from value.")
     parser.add_argument("-a", "--alias", required=True,
                         help="Comma‑separated field name(s) for the extracted data (e.g., 'aws.billed.duration').")
-    parser.add_argument("--custom", help="Comma‑separated raw DPL fragment(s) to use directly, bypassing automatic matcher creation. Useful for advanced matchers like ENUM, REGEX, MASK, DROP, etc.")
-
+    parser.add_argument("--custom", help="Comma‑separated raw DPL fragment(s) to use directly, bypassing automatic matcher creation. Useful for advanced matchers like ENUM or REGEX; see --sensitive for masking.")
+    parser.add_argument("--enum-file",
+                        help="JSON file mapping field names to enum values, e.g. {\"loglevel\": {\"INFO\": 0, \"WARN\": 1}}.")
+    parser.add_argument("--corpus",
+                        help="Log corpus (JSON lines or plain text, '-' for stdin) scanned to discover low‑cardinality fields that become ENUM matchers and to pick INT/LONG/FLOAT/DOUBLE for numeric fields.")
+    parser.add_argument("--multiline", action="store_true",
+                        help="Join --corpus lines into multiline records (stack traces) by their start‑of‑record timestamp before analysing them.")
+    parser.add_argument("--sensitive", choices=["mask", "drop"],
+                        help="Detect emails, IPs, card numbers, API keys and tokens in the sample (and --corpus) and add steps that mask them with *** or drop them.")
+    parser.add_argument("--library",
+                        help="JSON rule library. Reports existing rules that already match the sample and, unless --dry-run, adds the new rule.")
 
     parser.add_argument("--open-pipeline", action="store_true",
                         help="If set, output an OpenPipeline YAML snippet instead of classic DPL.")
@@ -40,12 +51,31 @@ def main():
             aliases=args.alias,
             open_pipeline=args.open_pipeline,
             custom=args.custom,
+            enum_file=args.enum_file,
+            corpus_file=args.corpus,
+            sensitive=args.sensitive,
+            multiline=args.multiline,
+            verbose=args.verbose,
         )
         if args.dry_run:
             print(rule)
         else:
             # By default just print – user can redirect to a file if they wish
             print(rule)
+        if args.library:
+            library = RuleLibrary.load(args.library)
+            content = read_json(args.file).get("content", "")
+            try:
+                covering = library.match(content)
+                for rule_id, _ in covering:
+                    print(f"Note: existing rule {rule_id} already matches this log line: {library.rules[rule_id]}",
+                          file=sys.stderr)
+                if not covering and not args.dry_run:
+                    library.add(rule)
+                    library.save()
+            except ValueError as exc:
+                # e.g. --custom fragments outside the DPL subset the local evaluator understands
+                print(f"Warning: rule library '{args.library}' not checked or updated: {exc}", file=sys.stderr)
     except Exception as exc:
         print(f"Error: {exc}", file=sys.stderr)
         sys.exit(1)
@@ -0,0 +1,69 @@
+import argparse
+import os
+import sys
+
+from dynatrace_rule_helper.engine.drift import DEFAULT_MATCH_DROP, DEFAULT_NEW_SHAPE_RATE, DEFAULT_WINDOW, DriftMonitor
+from dynatrace_rule_helper.utils.file_io import iter_log_lines
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        description="Watch a live log stream and alert when a deployed rule stops matching its format.")
+    parser.add_argument("-r", "--rule", required=True,
+                        help="The deployed PARSE rule, or a file whose first non‑comment line is the rule.")
+    parser.add_argument("-f", "--file", default="-",
+                        help="Log stream – JSON lines with a 'content' field or plain text (default: '-' for stdin).")
+    parser.add_argument("--follow", action="store_true",
+                        help="Keep reading lines appended to --file, like 'tail -f'.")
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW,
+                        help=f"Lines per evaluation window (default: {DEFAULT_WINDOW}).")
+    parser.add_argument("--window-seconds", type=float, default=None,
+                        help="Also close a window after this many seconds, so quiet streams are checked too "
+                             "(default: by line count only).")
+    parser.add_argument("--baseline-windows", type=int, default=1,
+                        help="Initial windows that define the expected match rates (default: 1).")
+    parser.add_argument("--match-drop", type=float, default=DEFAULT_MATCH_DROP,
+                        help=f"Alert when a match rate drops by more than this fraction (default: {DEFAULT_MATCH_DROP}).")
+    parser.add_argument("--new-shape-rate", type=float, default=DEFAULT_NEW_SHAPE_RATE,
+                        help=f"Alert when more than this share of lines has unseen shapes (default: {DEFAULT_NEW_SHAPE_RATE}).")
+    return parser.parse_args()
+
+def read_rule(value: str) -> str:
+    """Return *value* itself or, if it names a file, the first rule in that file."""
+    if not os.path.isfile(value):
+        return value
+    with open(value, "r", encoding="utf-8-sig") as f:
+        for line in f:
+            if line.strip() and not line.lstrip().startswith("#"):
+                return line.strip()
+    raise Exception(f"No rule found in '{value}'.")
+
+def main():
+    args = parse_arguments()
+    try:
+        monitor = DriftMonitor(
+            read_rule(args.rule),
+            window=args.window,
+            window_seconds=args.window_seconds,
+            baseline_windows=args.baseline_windows,
+            match_drop=args.match_drop,
+            new_shape_rate=args.new_shape_rate,
+        )
+
+        def report_idle():
+            # No new lines – a window may still be due
+            for alert in monitor.tick():
+                print(alert, flush=True)
+
+        for line in iter_log_lines(args.file, follow=args.follow, on_idle=report_idle):
+            for alert in monitor.feed(line):
+                print(alert, flush=True)
+        for alert in monitor.flush():
+            print(alert, flush=True)
+    except KeyboardInterrupt:
+        pass
+    except Exception as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -3,36 +3,51 @@ building the DPL rule, and enforcing limits.
 """
 
 import json
+import sys
 from pathlib import Path
 from typing import Optional, List
 
 from dynatrace_rule_helper.engine.inference import infer_literal_from_value, guess_matcher_type
+from dynatrace_rule_helper.engine.enum_discovery import EnumDiscovery, load_enum_file
+from dynatrace_rule_helper.engine.evaluator import CompiledRule
+from dynatrace_rule_helper.engine.multiline import RecordAssembler, assemble_records
 from dynatrace_rule_helper.engine.limits import enforce_rule_size, validate_literal, validate_fragment_count
-from dynatrace_rule_helper.engine.pattern_builder import build_parse_rule
+from dynatrace_rule_helper.engine.numeric_profile import NumericProfiler
+from dynatrace_rule_helper.engine.pattern_builder import build_processing_rule
+from dynatrace_rule_helper.engine.sensitive import SensitiveScanner
+from dynatrace_rule_helper.utils.file_io import iter_log_lines
 
 # Import concrete matcher classes
 from dynatrace_rule_helper.matcher.timestamp import TimestampMatcher
 from dynatrace_rule_helper.matcher.ld import LDMatcher
 from dynatrace_rule_helper.matcher.int import IntMatcher
+from dynatrace_rule_helper.matcher.long import LongMatcher
 from dynatrace_rule_helper.matcher.float import FloatMatcher
+from dynatrace_rule_helper.matcher.double import DoubleMatcher
 from dynatrace_rule_helper.matcher.string import StringMatcher
 from dynatrace_rule_helper.matcher.ipaddr import IPAddrMatcher
 from dynatrace_rule_helper.matcher.url import URLMatcher
 from dynatrace_rule_helper.matcher.json_matcher import JSONMatcher
-# Future: import EnumMatcher, RegexMatcher, etc.
+from dynatrace_rule_helper.matcher.enum import EnumMatcher
+from dynatrace_rule_helper.matcher.mask import MaskMatcher
+# Future: import RegexMatcher, etc.
 
 MATCHER_MAP = {
     "INT": IntMatcher,
+    "LONG": LongMatcher,
     "FLOAT": FloatMatcher,
+    "DOUBLE": DoubleMatcher,
     "STRING": StringMatcher,
     "IPADDR": IPAddrMatcher,
     "URL": URLMatcher,
     "JSON": JSONMatcher,
-    # "ENUM": EnumMatcher,
     # "REGEX": RegexMatcher,
     # "TIMESTAMP": TimestampMatcher (handled specially)
+    # "ENUM": EnumMatcher (handled specially – needs a mapping)
 }
 
+NUMERIC_TYPES = ("INT", "LONG", "FLOAT", "DOUBLE")
+
 def process_log_file(
     file_path: str,
     literals: Optional[str] = None,
@@ -43,6 +58,9 @@ def process_log_file(
     open_pipeline: bool = False,
     verbose: bool = False,
     custom: Optional[str] = None,
+    corpus_file: Optional[str] = None,
+    sensitive: Optional[str] = None,
+    multiline: bool = False,
 ) -> str:
     """Main entry point used by the CLI.
 
@@ -59,13 +77,27 @@ def process_log_file(
     aliases: str
         Comma‑separated export names – required.
     enum_file: Optional[str]
-        Path to a JSON file with enum mappings (future support).
+        Path to a JSON file with enum mappings (``{"loglevel": {"INFO": 0, ...}}``).
+        Fields listed there are emitted as ``ENUM`` instead of ``STRING``.
     open_pipeline: bool
         If True we would emit an OpenPipeline YAML snippet (stub for now).
     verbose: bool
-        Enable debug prints.
+        Enable debug prints (e.g. why a numeric matcher was chosen).
     custom: Optional[str]
         Comma‑separated raw DPL fragment(s) that bypass automatic matcher creation.
+    corpus_file: Optional[str]
+        Log corpus (JSON lines or plain text) streamed once to discover
+        low‑cardinality fields that should become ``ENUM`` matchers and to
+        profile numeric fields so the narrowest of ``INT``/``LONG``/``FLOAT``/
+        ``DOUBLE`` holds every observed value.
+    sensitive: Optional[str]
+        ``"mask"`` or ``"drop"``: scan the sample (and the corpus, in the same
+        pass) for emails, IPs, card numbers, keys and tokens, and add a
+        masking step for each kind found.  ``drop`` removes the value instead
+        of replacing it with ``***``.
+    multiline: bool
+        Assemble corpus lines into multiline records (stack traces) before
+        they are analysed, so every analysis sees whole events.
     """
     # ------------------------------------------------------------------
     # 1️⃣ Load the JSON file
@@ -98,6 +130,11 @@ def process_log_file(
 
     fragments: List[str] = []
 
+    if sensitive and sensitive not in ("mask", "drop"):
+        raise Exception(f"Unsupported sensitive data mode: {sensitive} (use 'mask' or 'drop').")
+    scanner = SensitiveScanner() if sensitive else None
+    corpus_scanned = False
+
     # Parse custom fragments if provided (they bypass automatic matcher creation)
     # Use a simple split only when multiple aliases are expected; otherwise keep the whole string.
     if custom and count == 1:
@@ -115,6 +152,7 @@ def process_log_file(
         # ------------------------------------------------------------------
         # 3️⃣ Build a matcher for each extraction request (original path)
         # ------------------------------------------------------------------
+        resolved = []
         for idx, alias in enumerate(alias_list):
             # Resolve literal and value for this alias
             literal = literal_list[idx] if literal_list else None
@@ -138,6 +176,52 @@ def process_log_file(
                         mtype = guess_matcher_type(value)
                     else:
                         mtype = "STRING"
+            resolved.append((alias, literal, mtype))
+
+        # Inferred STRING fields become ENUMs when a mapping is known or discovered,
+        # inferred numeric fields get the narrowest matcher that fits the corpus
+        def _enum_candidate(mtype: str) -> bool:
+            return mtype == "ENUM" or (not type_list and mtype in ("STRING", "UPPER"))
+
+        enum_mappings = load_enum_file(enum_file) if enum_file else {}
+        numeric_types = {}
+        if corpus_file:
+            enum_fields = {
+                alias: literal for alias, literal, mtype in resolved
+                if _enum_candidate(mtype) and literal and alias not in enum_mappings
+            }
+            numeric_fields = {
+                alias: literal for alias, literal, mtype in resolved
+                if not type_list and mtype in NUMERIC_TYPES and literal
+            }
+            if enum_fields or numeric_fields or scanner:
+                discovery = EnumDiscovery(enum_fields)
+                profiler = NumericProfiler(numeric_fields)
+                # The rule has to match its own sample line
+                discovery.add_sample(content)
+                profiler.add_line(content)
+                # One pass over the corpus feeds every analysis
+                for line in _corpus_records(corpus_file, multiline, verbose):
+                    discovery.add_line(line)
+                    profiler.add_line(line)
+                    if scanner:
+                        scanner.add_line(line)
+                corpus_scanned = True
+                enum_mappings.update(discovery.mappings())
+                for alias, omitted in discovery.omitted.items():
+                    print(f"Warning: ENUM for '{alias}' leaves out {omitted} rare observation(s); "
+                          f"lines with those values will not match.", file=sys.stderr)
+                for alias, profile in profiler.results().items():
+                    choice = profile.choose()
+                    if choice:
+                        numeric_types[alias] = choice
+                    if verbose:
+                        print(f"{alias}: {choice or 'unchanged'} – " + "; ".join(profile.explain()), file=sys.stderr)
+
+        for alias, literal, mtype in resolved:
+            if alias in enum_mappings and _enum_candidate(mtype):
+                mtype = "ENUM"
+            mtype = numeric_types.get(alias, mtype)
             # Special handling for timestamps – DPL has a dedicated function
             if mtype == "TIMESTAMP":
                 pattern = TimestampMatcher.infer_pattern(content)
@@ -149,6 +233,11 @@ def process_log_file(
                 # Upper‑case transformation – no literal needed
                 fragments.append(f"UPPER:{alias}")
                 continue
+            elif mtype == "ENUM":
+                if alias not in enum_mappings:
+                    raise Exception(f"No enum mapping found for '{alias}' – supply --enum-file or --corpus.")
+                matcher = EnumMatcher(export_name=alias, mapping=enum_mappings[alias], literal=literal)
+                fragments.append(matcher.build())
             else:
                 MatcherCls = MATCHER_MAP.get(mtype)
                 if not MatcherCls:
@@ -165,7 +254,13 @@ def process_log_file(
     # 4️⃣ Validate overall limits
     # ------------------------------------------------------------------
     validate_fragment_count(fragments)
-    dpl_rule = build_parse_rule(fragments)
+    before: List[str] = []
+    after: List[str] = []
+    if scanner:
+        if corpus_file and not corpus_scanned:
+            scanner.add_many(_corpus_records(corpus_file, multiline, verbose))
+        before, after = _masking_steps(scanner, content, fragments, sensitive == "drop", verbose)
+    dpl_rule = build_processing_rule(fragments, before, after)
     enforce_rule_size(dpl_rule)
 
     # ------------------------------------------------------------------
@@ -177,3 +272,48 @@ def process_log_file(
         # Future implementation: translate fragments into OpenPipeline JSON/YAML.
         return dpl_rule  # placeholder
     return dpl_rule
+
+def _corpus_records(corpus_file: str, multiline: bool, verbose: bool):
+    """Stream the corpus – one item per line, or per record with *multiline*."""
+    if not multiline:
+        yield from iter_log_lines(corpus_file)
+        return
+    assembler = RecordAssembler()
+    yield from assemble_records(iter_log_lines(corpus_file), assembler)
+    if verbose:
+        print(f"corpus: {assembler.lines} lines → {assembler.records} records, {assembler.describe()}"
+              + (f", {assembler.truncated} oversized record(s) truncated" if assembler.truncated else ""),
+              file=sys.stderr)
+
+def _masking_steps(scanner: SensitiveScanner, content: str, fragments: List[str], drop: bool, verbose: bool):
+    """Return the masking commands to run before and after ``PARSE``.
+
+    Masks run before ``PARSE`` so extracted fields never see the raw value –
+    except where a value in the sample is itself extracted: masking it first
+    would make the typed matcher fail, so that mask runs after ``PARSE``.
+    """
+    sample_hits = scanner.add_line(content)
+    try:
+        spans = CompiledRule(build_processing_rule(fragments)).spans(content)
+    except ValueError:
+        # Custom fragments the local evaluator does not understand
+        spans = {}
+    extracted = {}
+    for hit in sample_hits:
+        for alias, (start, end) in spans.items():
+            if start < hit.end and hit.start < end:
+                extracted.setdefault(hit.pattern, alias)
+
+    before, after = [], []
+    for finding in scanner.ranked():
+        step = MaskMatcher(finding.pattern, key=finding.key, drop=drop).build()
+        if finding.pattern in extracted:
+            after.append(step)
+            print(f"Note: field '{extracted[finding.pattern]}' extracts {finding.detector} data; "
+                  f"it is masked in content only, after PARSE.", file=sys.stderr)
+        else:
+            before.append(step)
+        if verbose:
+            print(f"{finding.detector}: {finding.count} hit(s), e.g. {finding.example} – masked with {finding.pattern}",
+                  file=sys.stderr)
+    return before, after
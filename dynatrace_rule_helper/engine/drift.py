@@ -0,0 +1,271 @@
+"""Streaming format‑drift detection for a deployed rule.
+
+Lines are processed in tumbling windows of ``window`` lines or, with
+``window_seconds``, of at most that much time – a quiet service still gets
+its windows evaluated, and a stream that stops matching is reported within
+minutes instead of after the next ``window`` lines.  A window closed by time,
+or the partial window left at the end of input, is only evaluated once it
+holds ``min_window_lines`` lines; a handful of lines says nothing about the
+match rate.  For every line the monitor records
+its shape signature (see :func:`line_shape`) and whether the rule – and each
+of its exported fields – matched.  At the end of a window:
+
+* the overall and per‑field match rates are compared with a rolling
+  baseline: the average of the first ``baseline_windows`` windows, then an
+  exponentially weighted average updated by every window that raised no rate
+  alert – slow, legitimate shifts are absorbed, sudden drops are not;
+* the window's shapes are looked up in the set of recently seen shapes – a
+  sizeable share of unknown shapes means the format changed.  The set is
+  exact and bounded: shapes not seen for ``shape_ttl`` windows expire, and at
+  most ``max_known_shapes`` are kept (least recently seen go first), so it
+  never saturates the way a never‑decaying sketch would.
+
+Per line the work is a literal prefilter, at most one regex match, one
+``bytes.translate`` and a dict increment; the known‑shape set is only touched
+once per distinct shape per window.  This keeps the overhead in the low
+microseconds, enough to run as a sidecar next to a busy service.
+"""
+
+import time
+from typing import Callable, Dict, List, Optional
+
+from dynatrace_rule_helper.engine.evaluator import CompiledRule
+from dynatrace_rule_helper.utils.shape import line_shape
+
+DEFAULT_WINDOW = 10_000
+DEFAULT_MATCH_DROP = 0.10       # absolute drop in match rate that raises an alert
+DEFAULT_NEW_SHAPE_RATE = 0.01   # share of lines with unseen shapes that raises an alert
+MAX_WINDOW_SHAPES = 4096        # distinct shapes tracked per window
+DEFAULT_MAX_KNOWN_SHAPES = 50_000
+DEFAULT_SHAPE_TTL = 1000        # windows a shape stays known without being seen
+DEFAULT_BASELINE_ALPHA = 0.1    # weight of the newest window in the rolling baseline
+DEFAULT_MIN_WINDOW_LINES = 20   # lines a window closed early needs to be evaluated
+OTHER_SHAPES = "*"
+
+class DriftAlert:
+    """A single alert raised at the end of a window."""
+
+    def __init__(self, kind: str, window: int, message: str):
+        self.kind = kind            # "match_rate", "field_rate" or "new_shapes"
+        self.window = window
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"[ALERT] window {self.window}: {self.message}"
+
+class WindowStats:
+    """Counters for one window."""
+
+    def __init__(self, exports: List[str]):
+        self.lines = 0
+        self.matched = 0
+        self.fields: Dict[str, int] = {name: 0 for name in exports}
+        self.shapes: Dict[str, int] = {}
+
+    @property
+    def match_rate(self) -> float:
+        return self.matched / self.lines if self.lines else 0.0
+
+    def field_rate(self, name: str) -> float:
+        return self.fields[name] / self.lines if self.lines else 0.0
+
+class DriftMonitor:
+    """Watch a live log stream for lines a deployed rule no longer understands.
+
+    Parameters
+    ----------
+    rule: str
+        The deployed DPL rule.
+    window: int
+        Number of lines per evaluation window.
+    window_seconds: Optional[float]
+        Also close a window once it is this old (``None``: by line count only).
+    min_window_lines: int
+        Lines a window closed by time or by :meth:`flush` needs to be evaluated.
+    baseline_windows: int
+        Number of initial windows that define the expected match rates.
+    match_drop: float
+        Alert when a match rate falls this much (absolute) below its baseline.
+    new_shape_rate: float
+        Alert when more than this share of a window's lines have unseen shapes.
+    baseline_alpha: float
+        Weight of each alert‑free window in the rolling baseline.
+    max_known_shapes: int
+        Upper bound on the number of remembered shapes.
+    shape_ttl: int
+        Windows after which a shape that has not been seen again is forgotten.
+    clock: Callable[[], float]
+        Time source for ``window_seconds``.
+    """
+
+    def __init__(
+        self,
+        rule: str,
+        window: int = DEFAULT_WINDOW,
+        baseline_windows: int = 1,
+        match_drop: float = DEFAULT_MATCH_DROP,
+        new_shape_rate: float = DEFAULT_NEW_SHAPE_RATE,
+        baseline_alpha: float = DEFAULT_BASELINE_ALPHA,
+        max_known_shapes: int = DEFAULT_MAX_KNOWN_SHAPES,
+        shape_ttl: int = DEFAULT_SHAPE_TTL,
+        window_seconds: Optional[float] = None,
+        min_window_lines: int = DEFAULT_MIN_WINDOW_LINES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if window < 1 or baseline_windows < 1 or max_known_shapes < 1 or shape_ttl < 1:
+            raise ValueError("window, baseline_windows, max_known_shapes and shape_ttl must be positive.")
+        if window_seconds is not None and window_seconds <= 0:
+            raise ValueError("window_seconds must be positive.")
+        self.compiled = CompiledRule(rule)
+        self.window = window
+        self.window_seconds = window_seconds
+        self.min_window_lines = max(1, min(min_window_lines, window))
+        self.clock = clock
+        self.baseline_windows = baseline_windows
+        self.match_drop = match_drop
+        self.new_shape_rate = new_shape_rate
+        self.baseline_alpha = baseline_alpha
+        self.max_known_shapes = max_known_shapes
+        self.shape_ttl = shape_ttl
+        self.windows = 0
+        # Rolling baseline: overall and per‑field match rates
+        self.baseline_rate: Optional[float] = None
+        self.baseline_fields: Dict[str, float] = {}
+        # Shape → window it was last seen in, ordered from least to most recent
+        self.known_shapes: Dict[str, int] = {}
+        self._current = WindowStats(self.compiled.exports)
+        self._started = clock()
+        self._anchors = self.compiled.literals
+
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+    def feed(self, line: str) -> List[DriftAlert]:
+        """Process one line; returns the alerts of a window that just closed."""
+        stats = self._current
+        stats.lines += 1
+
+        shapes = stats.shapes
+        shape = line_shape(line)
+        if shape in shapes:
+            shapes[shape] += 1
+        elif len(shapes) < MAX_WINDOW_SHAPES:
+            shapes[shape] = 1
+        else:
+            shapes[OTHER_SHAPES] = shapes.get(OTHER_SHAPES, 0) + 1
+
+        # Cheap literal check first – most non‑matching lines stop here
+        for anchor in self._anchors:
+            if anchor not in line:
+                break
+        else:
+            m = self.compiled.regex.match(line)
+            if m:
+                stats.matched += 1
+                fields = stats.fields
+                for name, value in zip(self.compiled.exports, m.groups()):
+                    if value is not None:
+                        fields[name] += 1
+
+        if stats.lines >= self.window:
+            return self._close_window()
+        if self.window_seconds is not None:
+            return self.tick()
+        return []
+
+    def tick(self) -> List[DriftAlert]:
+        """Close the current window if it is older than ``window_seconds``.
+
+        Called for every line, and by callers waiting for input so that an
+        idle stream still gets its window evaluated.
+        """
+        if (self.window_seconds is None or self._current.lines < self.min_window_lines
+                or self.clock() - self._started < self.window_seconds):
+            return []
+        return self._close_window()
+
+    def flush(self) -> List[DriftAlert]:
+        """Close the current partial window (e.g. at end of input).
+
+        A window with fewer than ``min_window_lines`` lines is dropped unjudged.
+        """
+        if self._current.lines < self.min_window_lines:
+            self._current = WindowStats(self.compiled.exports)
+            return []
+        return self._close_window()
+
+    # ------------------------------------------------------------------
+    # Window evaluation
+    # ------------------------------------------------------------------
+    def _close_window(self) -> List[DriftAlert]:
+        stats = self._current
+        self._current = WindowStats(self.compiled.exports)
+        self._started = self.clock()
+        self.windows += 1
+        alerts: List[DriftAlert] = []
+
+        if self.windows <= self.baseline_windows:
+            # Plain average over the baseline windows
+            self._update_baseline(stats, 1 / self.windows)
+        else:
+            rate_alerts = self._rate_alerts(stats)
+            if not rate_alerts:
+                self._update_baseline(stats, self.baseline_alpha)
+            alerts.extend(rate_alerts)
+            alerts.extend(self._shape_alerts(stats))
+        self._remember_shapes(stats)
+        return alerts
+
+    def _update_baseline(self, stats: WindowStats, weight: float) -> None:
+        if self.baseline_rate is None:
+            weight = 1.0
+        previous = self.baseline_rate or 0.0
+        self.baseline_rate = previous + weight * (stats.match_rate - previous)
+        for name in stats.fields:
+            previous = self.baseline_fields.get(name, 0.0)
+            self.baseline_fields[name] = previous + weight * (stats.field_rate(name) - previous)
+
+    def _remember_shapes(self, stats: WindowStats) -> None:
+        known = self.known_shapes
+        for shape in stats.shapes:
+            if shape != OTHER_SHAPES:
+                # Re‑insert so the dict stays ordered by last sighting
+                known.pop(shape, None)
+                known[shape] = self.windows
+        expired = self.windows - self.shape_ttl
+        while known:
+            oldest = next(iter(known))
+            if len(known) <= self.max_known_shapes and known[oldest] > expired:
+                break
+            del known[oldest]
+
+    def _rate_alerts(self, stats: WindowStats) -> List[DriftAlert]:
+        alerts = []
+        if self.baseline_rate - stats.match_rate > self.match_drop:
+            alerts.append(DriftAlert(
+                "match_rate", self.windows,
+                f"rule match rate {stats.match_rate:.1%} (baseline {self.baseline_rate:.1%})",
+            ))
+            # Every field drops with the rule – per‑field alerts would only repeat it
+            return alerts
+        for name in stats.fields:
+            baseline = self.baseline_fields[name]
+            if baseline - stats.field_rate(name) > self.match_drop:
+                alerts.append(DriftAlert(
+                    "field_rate", self.windows,
+                    f"field '{name}' extracted in {stats.field_rate(name):.1%} of lines "
+                    f"(baseline {baseline:.1%})",
+                ))
+        return alerts
+
+    def _shape_alerts(self, stats: WindowStats) -> List[DriftAlert]:
+        new = {shape: count for shape, count in stats.shapes.items()
+               if shape != OTHER_SHAPES and shape not in self.known_shapes}
+        new_lines = sum(new.values())
+        if not new or new_lines <= self.new_shape_rate * stats.lines:
+            return []
+        examples = ", ".join(repr(shape) for shape, _ in sorted(new.items(), key=lambda sc: -sc[1])[:3])
+        return [DriftAlert(
+            "new_shapes", self.windows,
+            f"{len(new)} new line shapes in {new_lines / stats.lines:.1%} of lines, e.g. {examples}",
+        )]
@@ -0,0 +1,175 @@
+"""Corpus‑driven discovery of low‑cardinality fields that should become ENUMs.
+
+Every candidate field (an export name plus the literal that precedes its value)
+gets its own Count‑Min sketch and Space‑Saving heavy‑hitters summary.  The
+corpus is streamed once; memory stays bounded by the sketch sizes regardless
+of how many lines or distinct values are seen.
+
+A field is reported as an enum when it has only a few distinct values, each
+seen repeatedly – typical for log levels, HTTP methods or status strings.  A
+field with a single value, or with values that rarely repeat, is left alone:
+that is a constant or an identifier, and an enum would reject its next value.
+Every observed value is part of the enum, so rare values (``FATAL``) still
+match once the rule is deployed, and a field whose enum would leave out the
+value of the sample line the rule is built from is never an enum.
+"""
+
+import json
+from typing import Dict, Iterable, Optional, Set
+
+from dynatrace_rule_helper.engine.inference import compile_value_extractor
+from dynatrace_rule_helper.utils.sketch import CountMinSketch, SpaceSaving
+
+DEFAULT_MAX_VALUES = 16         # largest enum we are willing to emit
+DEFAULT_MIN_COVERAGE = 0.9999   # share of observations an incomplete enum must explain
+DEFAULT_MIN_SAMPLES = 20        # below this we cannot tell enum from chance
+DEFAULT_MIN_REPEATS = 5         # observations per distinct value an enum needs on average
+PENDING_LIMIT = 4096            # distinct values buffered per field before a sketch flush
+
+class EnumDiscovery:
+    """Streaming enum detector for a fixed set of candidate fields.
+
+    Parameters
+    ----------
+    fields: Dict[str, str]
+        Maps export name → literal that precedes the value in the log line.
+    max_values: int
+        Maximum number of distinct values an enum may have.
+    min_coverage: float
+        Fraction of observations the kept values must account for when the
+        field has more than ``max_values`` distinct values.
+    min_samples: int
+        Minimum number of observations before a field can be classified.
+    min_repeats: int
+        Minimum average number of observations per distinct value.
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, str],
+        max_values: int = DEFAULT_MAX_VALUES,
+        min_coverage: float = DEFAULT_MIN_COVERAGE,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        min_repeats: int = DEFAULT_MIN_REPEATS,
+        sketch_width: int = 2048,
+        sketch_depth: int = 4,
+    ):
+        self.max_values = max_values
+        self.min_coverage = min_coverage
+        self.min_samples = min_samples
+        self.min_repeats = min_repeats
+        self._extractors = {name: compile_value_extractor(lit) for name, lit in fields.items() if lit}
+        self._sketches = {name: CountMinSketch(sketch_width, sketch_depth) for name in self._extractors}
+        # Track a few more items than we emit so near‑misses do not evict real values
+        self._heavy = {name: SpaceSaving(4 * max_values) for name in self._extractors}
+        # Exact counts are buffered in a small dict and flushed in batches – for
+        # enum‑like fields this turns millions of sketch updates into a handful.
+        self._pending: Dict[str, Dict[str, int]] = {name: {} for name in self._extractors}
+        # Fields whose counts overflowed into the (approximate) sketches
+        self._sketched: Set[str] = set()
+        # Observations left out of an emitted enum, per field
+        self.omitted: Dict[str, int] = {}
+        # Values of the sample line – an enum must keep them
+        self._required: Dict[str, str] = {}
+
+    def add_line(self, line: str) -> None:
+        """Extract every candidate field from *line* and update its sketches."""
+        for name, extractor in self._extractors.items():
+            m = extractor.search(line)
+            if m:
+                self.add_value(name, m.group(1))
+
+    def add_sample(self, line: str) -> None:
+        """Add the sample line the rule is built from; its values must stay in the enum."""
+        for name, extractor in self._extractors.items():
+            m = extractor.search(line)
+            if m:
+                self._required[name] = m.group(1)
+                self.add_value(name, m.group(1))
+
+    def add_value(self, name: str, value: str) -> None:
+        pending = self._pending[name]
+        pending[value] = pending.get(value, 0) + 1
+        if len(pending) > PENDING_LIMIT:
+            self._sketched.add(name)
+            self._flush(name)
+
+    def _flush(self, name: str) -> None:
+        sketch = self._sketches[name]
+        heavy = self._heavy[name]
+        for value, count in self._pending[name].items():
+            sketch.add(value, count)
+            heavy.add(value, count)
+        self._pending[name] = {}
+
+    def mapping(self, name: str) -> Optional[Dict[str, int]]:
+        """Return the enum mapping for *name* or ``None`` if it is not an enum.
+
+        While a field has fewer than ``PENDING_LIMIT`` distinct values its
+        counts are exact, and if they fit into ``max_values`` every observed
+        value is kept – rare values such as ``FATAL`` are the ones that matter.
+        Otherwise the ``max_values`` most frequent values must cover
+        ``min_coverage`` of the observations; the rest is recorded in
+        :attr:`omitted` so callers can warn about it.  Values are numbered by
+        descending frequency, so the most common value gets ``0``.
+
+        Fields with a single distinct value, fewer than ``min_repeats``
+        observations per distinct value, or a mapping without the sample
+        value are not enums.
+        """
+        if name not in self._extractors:
+            return None
+        if name in self._sketched:
+            self._flush(name)
+            sketch = self._sketches[name]
+            total = sketch.total
+            # Both structures overestimate – the smaller bound is the better one
+            counts = [(value, min(count, sketch.estimate(value))) for value, count in self._heavy[name].top()]
+        else:
+            counts = list(self._pending[name].items())
+            total = sum(count for _, count in counts)
+        if total < self.min_samples:
+            return None
+        ranked = sorted(counts, key=lambda vc: (-vc[1], vc[0]))
+        complete = name not in self._sketched and len(ranked) <= self.max_values
+        if complete and (len(ranked) < 2 or total < self.min_repeats * len(ranked)):
+            return None
+        kept = ranked[:self.max_values]
+        covered = sum(count for _, count in kept)
+        if not complete:
+            if covered < self.min_coverage * total:
+                return None
+            # A sketched field has more distinct values than any enum can hold
+            self.omitted[name] = max(total - covered, 1)
+        mapping = {value: idx for idx, (value, _) in enumerate(kept)}
+        if name in self._required and self._required[name] not in mapping:
+            self.omitted.pop(name, None)
+            return None
+        return mapping
+
+    def mappings(self) -> Dict[str, Dict[str, int]]:
+        """Return the enum mapping of every candidate field that qualifies."""
+        result = {}
+        for name in self._extractors:
+            mapping = self.mapping(name)
+            if mapping:
+                result[name] = mapping
+        return result
+
+def discover_enums(lines: Iterable[str], fields: Dict[str, str], **kwargs) -> Dict[str, Dict[str, int]]:
+    """Stream *lines* once and return ``{export name: {value: id}}`` for enum fields."""
+    discovery = EnumDiscovery(fields, **kwargs)
+    for line in lines:
+        discovery.add_line(line)
+    return discovery.mappings()
+
+def load_enum_file(file_path: str) -> Dict[str, Dict[str, int]]:
+    """Read enum mappings from a JSON file of the form ``{"loglevel": {"INFO": 0}}``."""
+    try:
+        with open(file_path, "r", encoding="utf-8-sig") as f:
+            data = json.load(f)
+    except Exception as exc:
+        raise Exception(f"Failed to read enum file '{file_path}': {exc}")
+    if not isinstance(data, dict) or not all(isinstance(v, dict) for v in data.values()):
+        raise Exception("Enum file must map field names to {value: id} objects.")
+    return {name: {str(k): int(v) for k, v in mapping.items()} for name, mapping in data.items()}
@@ -0,0 +1,173 @@
+"""Local evaluator for the DPL subset produced by this tool.
+
+A ``PARSE(content, "...")`` rule is translated into a single Python regular
+expression so it can be checked against log lines without a Dynatrace tenant.
+Only the constructs the generator emits are supported: ``LD``, quoted
+literals, ``SPACE``, the numeric/string/IP/URL/JSON/UPPER matchers, ``ENUM``,
+``TIMESTAMP`` and character classes such as ``[0-9]{4}`` – plus the ``?``
+quantifier and ``:export`` names.
+
+The translation is an approximation of DPL semantics that is good enough to
+answer "would this rule match this line, and what would it extract?".
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Other ``|`` commands of a processing rule (masking steps, …) are ignored
+_RULE = re.compile(
+    r'(?:^|\|)\s*PARSE\s*\(\s*content\s*,\s*"(?P<inner>(?:\\.|[^"\\])*)"\s*\)\s*(?:\||$)', re.DOTALL
+)
+_TOKEN = re.compile(
+    r"""\s*(?:
+        '(?P<literal>(?:\\.|[^'\\])*)'
+      | (?P<charclass>\[(?:\\.|[^\]\\])+\])(?P<repeat>[+*]|\{\d+(?:,\d*)?\})?
+      | (?P<name>[A-Z][A-Z0-9_]*)(?:\((?P<args>(?:'(?:\\.|[^'\\])*'|[^)])*)\))?
+    )(?P<optional>\?)?(?::(?P<export>[A-Za-z_][\w.\-]*))?""",
+    re.VERBOSE,
+)
+_QUOTED = re.compile(r"'((?:\\.|[^'\\])*)'")
+
+_FLOAT = r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?"
+MATCHER_PATTERNS = {
+    "LD": r".*?",
+    "SPACE": r"\s+",
+    "INT": r"[-+]?\d+",
+    "LONG": r"[-+]?\d+",
+    "FLOAT": _FLOAT,
+    "DOUBLE": _FLOAT,
+    "STRING": r"\"[^\"]*\"|'[^']*'|\S+",
+    "IPADDR": r"(?:\d{1,3}\.){3}\d{1,3}|[0-9A-Fa-f]*:[0-9A-Fa-f:.]+",
+    "URL": r"[A-Za-z][A-Za-z0-9+.\-]*://\S+",
+    "JSON": r"\{.*\}",
+    "UPPER": r"[A-Z]+",
+}
+
+# DPL/Java timestamp letters → regex, longest first so ``MMMM`` wins over ``MM``
+_TIMESTAMP_TOKENS = [
+    ("yyyy", r"\d{4}"), ("yy", r"\d{2}"),
+    ("MMMM", r"[A-Za-z]+"), ("MMM", r"[A-Za-z]{3}"), ("MM", r"\d{2}"), ("M", r"\d{1,2}"),
+    # ``d`` also takes the space padding of syslog days (``Feb  1``)
+    ("dd", r"\d{2}"), ("d", r"[ \d]?\d"),
+    ("HH", r"\d{2}"), ("H", r"\d{1,2}"), ("hh", r"\d{2}"), ("h", r"\d{1,2}"),
+    ("mm", r"\d{2}"), ("ss", r"\d{2}"), ("SSS", r"\d{3,9}"), ("S", r"\d+"),
+    ("a", r"[AaPp][Mm]"), ("Z", r"[-+]\d{2}:?\d{2}|Z"), ("X", r"[-+]\d{2}(?::?\d{2})?|Z"),
+    ("EEEE", r"[A-Za-z]+"), ("EEE", r"[A-Za-z]{3}"),
+]
+
+def _unescape(text: str) -> str:
+    return re.sub(r"\\(.)", r"\1", text)
+
+def timestamp_regex(pattern: str) -> str:
+    """Translate a DPL timestamp pattern such as ``'MMMMM d, yyyy HH:mm:ss'``."""
+    out = []
+    pos = 0
+    while pos < len(pattern):
+        for token, regex in _TIMESTAMP_TOKENS:
+            if pattern.startswith(token, pos):
+                # Swallow repeated letters (``MMMMM`` → month name)
+                end = pos + len(token)
+                while end < len(pattern) and pattern[end] == token[0]:
+                    end += 1
+                out.append(regex)
+                pos = end
+                break
+        else:
+            out.append(re.escape(pattern[pos]))
+            pos += 1
+    return "".join(out)
+
+def split_rule(rule: str) -> str:
+    """Return the pattern inside the rule's ``PARSE(content, "...")`` (or *rule* itself)."""
+    m = _RULE.search(rule)
+    return m.group("inner") if m else rule
+
+def rule_literals(rule: str) -> List[str]:
+    """Return the quoted literals of *rule* that every matching line must contain.
+
+    Literals inside matcher arguments (``ENUM`` values, ``TIMESTAMP`` patterns)
+    are alternatives or formats, not fixed text, and are skipped, as are
+    literals made optional with ``?``.
+    """
+    literals = []
+    for m in _TOKEN.finditer(split_rule(rule)):
+        if m.group("literal") is not None and not m.group("optional") and m.group("literal"):
+            literals.append(_unescape(m.group("literal")))
+    return literals
+
+class CompiledRule:
+    """A DPL rule translated into a regular expression.
+
+    Attributes
+    ----------
+    rule: str
+        The original DPL rule.
+    exports: List[str]
+        Export names in the order of the regex groups.
+    literals: List[str]
+        Fixed text every matching line contains (see :func:`rule_literals`).
+    """
+
+    def __init__(self, rule: str):
+        self.rule = rule
+        self.exports: List[str] = []
+        self.literals = rule_literals(rule)
+        self.regex = re.compile(self._translate(split_rule(rule)), re.DOTALL)
+
+    def _translate(self, inner: str) -> str:
+        parts = []
+        pos = 0
+        inner = inner.rstrip()
+        while pos < len(inner):
+            m = _TOKEN.match(inner, pos)
+            if not m or m.end() == pos:
+                raise ValueError(f"Unsupported DPL syntax at: {inner[pos:pos + 30]!r}")
+            pos = m.end()
+            if m.group("literal") is not None:
+                piece = re.escape(_unescape(m.group("literal")))
+            elif m.group("charclass"):
+                piece = m.group("charclass") + (m.group("repeat") or "")
+            else:
+                piece = self._matcher(m.group("name"), m.group("args"))
+            if m.group("export"):
+                self.exports.append(m.group("export"))
+                piece = f"({piece})"
+            else:
+                piece = f"(?:{piece})"
+            if m.group("optional"):
+                piece += "?"
+            parts.append(piece)
+        return "".join(parts)
+
+    @staticmethod
+    def _matcher(name: str, args: Optional[str]) -> str:
+        if name == "ENUM":
+            values = [_unescape(v) for v in _QUOTED.findall(args or "")]
+            if not values:
+                raise ValueError("ENUM requires at least one quoted value.")
+            return "|".join(re.escape(v) for v in sorted(values, key=len, reverse=True))
+        if name == "TIMESTAMP":
+            pattern = _QUOTED.search(args or "")
+            if not pattern:
+                raise ValueError("TIMESTAMP requires a quoted pattern.")
+            return timestamp_regex(_unescape(pattern.group(1)))
+        if name not in MATCHER_PATTERNS:
+            raise ValueError(f"Unsupported DPL matcher: {name}")
+        return MATCHER_PATTERNS[name]
+
+    def spans(self, line: str) -> Dict[str, Tuple[int, int]]:
+        """Return ``{export: (start, end)}`` of the values extracted from *line*."""
+        m = self.regex.match(line)
+        if not m:
+            return {}
+        return {name: m.span(idx) for idx, name in enumerate(self.exports, 1) if m.start(idx) != -1}
+
+    def match(self, line: str) -> Optional[Dict[str, str]]:
+        """Return ``{export: value}`` if the rule matches *line*, else ``None``."""
+        m = self.regex.match(line)
+        if not m:
+            return None
+        return {name: value for name, value in zip(self.exports, m.groups()) if value is not None}
+
+def compile_rule(rule: str) -> CompiledRule:
+    return CompiledRule(rule)
@@ -28,14 +28,14 @@ def infer_literal_from_value(content: str, value: str) -> Tuple[str, str]:
 def guess_matcher_type(value: str) -> str:
     """Very naive type inference – returns one of the DPL matcher names.
 
-    * integer → ``INT``
+    * integer → ``INT`` (``LONG`` if it does not fit in 32 bits)
     * float   → ``FLOAT``
     * looks like an IP → ``IPADDR``
     * looks like a URL → ``URL``
     * otherwise ``STRING``
     """
     if re.fullmatch(r"-?\d+", value):
-        return "INT"
+        return "INT" if -2 ** 31 <= int(value) < 2 ** 31 else "LONG"
     if re.fullmatch(r"-?\d+\.\d+", value):
         return "FLOAT"
     if re.fullmatch(r"(?:\d{1,3}\.){3}\d{1,3}", value):
@@ -43,3 +43,23 @@ def guess_matcher_type(value: str) -> str:
     if re.match(r"^https?://", value):
         return "URL"
     return "STRING"
+
+_VALUE_AFTER_LITERAL = r"\s*[\"']?([^\s,;\"'\]\)\}]+)"
+_EXTRACTOR_CACHE = {}
+
+def compile_value_extractor(literal: str) -> "re.Pattern":
+    """Return a compiled regex whose first group is the token following *literal*.
+
+    Optional whitespace and an opening quote between the literal and the value
+    are skipped, and the token stops at whitespace, quotes or closing brackets.
+    """
+    pattern = _EXTRACTOR_CACHE.get(literal)
+    if pattern is None:
+        pattern = re.compile(re.escape(literal) + _VALUE_AFTER_LITERAL)
+        _EXTRACTOR_CACHE[literal] = pattern
+    return pattern
+
+def extract_value_after_literal(content: str, literal: str) -> Optional[str]:
+    """Return the token that follows the first *literal* in *content*, or ``None``."""
+    m = compile_value_extractor(literal).search(content)
+    return m.group(1) if m else None
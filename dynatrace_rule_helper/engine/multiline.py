@@ -0,0 +1,186 @@
+"""Streaming assembly of multiline log records (stack traces, tracebacks).
+
+Java and Python services write one event over several physical lines::
+
+    2024-01-01 12:00:03 ERROR Request failed
+    java.lang.IllegalStateException: boom
+        at com.example.Service.handle(Service.java:42)
+        ... 12 more
+
+The assembler learns what the first line of a record looks like and glues
+every following line onto the current record until the next start line.
+
+Learning looks at the first ``learn_lines`` lines only: every timestamp format
+in :data:`START_TIMESTAMPS` (DPL patterns such as the one
+:meth:`TimestampMatcher.infer_pattern` produces) is tried as an anchored
+prefix, and the one that starts the most lines wins – provided it starts
+more than half of the lines that do not already look like continuations.
+Otherwise (no timestamp prefix, or one that only appears by chance), lines
+are continuations if they are indented or look like a trace header
+(``Caused by:``, ``Traceback``, ``…Exception:``).
+
+Memory stays bounded: the learning buffer holds ``learn_lines`` lines and a
+record keeps at most ``max_lines`` lines / ``max_chars`` characters – the rest
+of an oversized record is dropped (and counted) until the next start line.
+Each line costs one anchored regex match.
+"""
+
+import re
+from typing import Iterable, Iterator, List, Optional, Pattern
+
+from dynatrace_rule_helper.engine.evaluator import timestamp_regex
+
+DEFAULT_LEARN_LINES = 1000
+DEFAULT_MAX_LINES = 500         # physical lines kept per record
+DEFAULT_MAX_CHARS = 64_000      # characters kept per record
+MIN_START_SHARE = 0.5           # share of non‑continuation lines a learned prefix must start
+
+# DPL timestamp patterns tried as record prefixes, most specific first
+START_TIMESTAMPS = [
+    "yyyy-MM-dd HH:mm:ss",
+    "yyyy-MM-ddTHH:mm:ss",
+    "yyyy/MM/dd HH:mm:ss",
+    "dd.MM.yyyy HH:mm:ss",
+    "dd/MMM/yyyy:HH:mm:ss",
+    "MMMMM d, yyyy HH:mm:ss",
+    "MMM d HH:mm:ss",
+    "HH:mm:ss",
+]
+
+# Without a timestamp prefix these lines still continue the previous record
+_CONTINUATION = re.compile(
+    r"\s|Caused by:|Suppressed:|Traceback \(|During handling|The above exception|\.\.\. \d+ more"
+    r"|[A-Za-z_$][\w$.]*(?:Exception|Error|Throwable)\b"
+)
+
+class RecordAssembler:
+    """Join continuation lines onto the record they belong to.
+
+    Parameters
+    ----------
+    learn_lines: int
+        Number of leading lines used to learn the start‑of‑record pattern.
+    max_lines: int
+        Maximum number of physical lines kept per record.
+    max_chars: int
+        Maximum number of characters kept per record.
+    start_pattern: Optional[str]
+        Regex for start lines; skips learning when given.
+    """
+
+    def __init__(
+        self,
+        learn_lines: int = DEFAULT_LEARN_LINES,
+        max_lines: int = DEFAULT_MAX_LINES,
+        max_chars: int = DEFAULT_MAX_CHARS,
+        start_pattern: Optional[str] = None,
+    ):
+        if learn_lines < 1 or max_lines < 1 or max_chars < 1:
+            raise ValueError("learn_lines, max_lines and max_chars must be positive.")
+        self.learn_lines = learn_lines
+        self.max_lines = max_lines
+        self.max_chars = max_chars
+        self.start: Optional[Pattern] = re.compile(start_pattern) if start_pattern else None
+        self.start_format: Optional[str] = None     # learned timestamp format, if any
+        self.lines = 0
+        self.records = 0
+        self.truncated = 0
+        self._learning: Optional[List[str]] = [] if self.start is None else None
+        self._record: List[str] = []
+        self._chars = 0
+        self._full = False
+
+    # ------------------------------------------------------------------
+    # Learning
+    # ------------------------------------------------------------------
+    def _learn(self, lines: List[str]) -> None:
+        best, best_count = None, 0
+        for fmt in START_TIMESTAMPS:
+            regex = re.compile(r"[\[(]?" + timestamp_regex(fmt))
+            count = sum(1 for line in lines if regex.match(line))
+            if count > best_count:
+                best, best_count = (fmt, regex), count
+        # A prefix that starts only a few lines is a coincidence, not the record
+        # format – anchoring on it would glue almost the whole log together
+        candidates = sum(1 for line in lines if not _CONTINUATION.match(line))
+        if best and best_count > MIN_START_SHARE * candidates:
+            self.start_format, self.start = best
+        else:
+            self.start = None
+
+    def _is_start(self, line: str) -> bool:
+        if self.start is not None:
+            return self.start.match(line) is not None
+        return _CONTINUATION.match(line) is None
+
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+    def feed(self, line: str) -> List[str]:
+        """Add one physical line; returns the records it completed."""
+        self.lines += 1
+        if self._learning is not None:
+            self._learning.append(line)
+            if len(self._learning) < self.learn_lines:
+                return []
+            return self._replay()
+        return self._add(line)
+
+    def flush(self) -> List[str]:
+        """Return the records still pending (e.g. at end of input)."""
+        records = self._replay() if self._learning is not None else []
+        if self._record:
+            records.append(self._emit())
+        return records
+
+    def _replay(self) -> List[str]:
+        buffered, self._learning = self._learning, None
+        self._learn(buffered)
+        records = []
+        for line in buffered:
+            records.extend(self._add(line))
+        return records
+
+    def _add(self, line: str) -> List[str]:
+        if self._is_start(line) and self._record:
+            record = self._emit()
+            self._start(line)
+            return [record]
+        if not self._record:
+            self._start(line)
+        elif self._full or len(self._record) >= self.max_lines or self._chars + len(line) > self.max_chars:
+            # Oversized record – keep its head, drop the rest until the next start
+            if not self._full:
+                self._full = True
+                self.truncated += 1
+        else:
+            self._record.append(line)
+            self._chars += len(line) + 1
+        return []
+
+    def _start(self, line: str) -> None:
+        self._record = [line[:self.max_chars]]
+        self._chars = len(self._record[0])
+        self._full = False
+
+    def _emit(self) -> str:
+        self.records += 1
+        record = "\n".join(self._record)
+        self._record = []
+        self._chars = 0
+        return record
+
+    def describe(self) -> str:
+        """One line saying how record starts are recognised."""
+        if self.start_format:
+            return f"records start with a '{self.start_format}' timestamp"
+        if self.start is not None:
+            return f"records start with /{self.start.pattern}/"
+        return "records start with any line that is not indented or a stack trace line"
+
+def assemble_records(lines: Iterable[str], assembler: Optional[RecordAssembler] = None) -> Iterator[str]:
+    """Stream *lines* and yield whole multiline records."""
+    assembler = assembler or RecordAssembler()
+    for line in lines:
+        yield from assembler.feed(line)
+    yield from assembler.flush()
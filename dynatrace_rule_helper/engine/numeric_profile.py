@@ -0,0 +1,275 @@
+"""Corpus‑wide profiling of numeric fields to pick the narrowest DPL matcher.
+
+A single sample value cannot tell ``INT`` from ``FLOAT`` (``12`` vs ``12.5``)
+or notice that a counter overflows 32 bits.  ``NumericProfile`` collects every
+value seen for a field and derives range, integrality, sign, precision and
+outlier statistics, then chooses between ``INT``, ``LONG``, ``FLOAT`` and
+``DOUBLE`` and explains why.
+
+Values are processed in batches: the tokens of a batch are joined once and
+inspected with C‑level ``bytes``/``str`` operations – precision is read off
+the few distinct digit *shapes* of a batch (``100.123`` → ``999.999``) rather
+than off every token – parsed into an ``array('d')`` and reduced without a
+per‑value Python loop.  NumPy is used for parsing and the reductions when it
+is installed; without it the builtins do the same work a little slower.
+"""
+
+import operator
+import re
+from array import array
+from itertools import islice
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # optional – the builtin path below is used instead
+    np = None
+
+from dynatrace_rule_helper.engine.inference import compile_value_extractor
+
+INT32_MIN, INT32_MAX = -2 ** 31, 2 ** 31 - 1
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+FLOAT32_MAX = 3.4028234663852886e38
+FLOAT32_DIGITS = 6               # significant decimal digits a FLOAT round‑trips (FLT_DIG)
+OUTLIER_SIGMA = 4.0              # values further than this from the mean are flagged
+BATCH_SIZE = 65_536
+
+_NUMERIC_BYTES = b"0123456789.-+eE\n"
+_NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_EXPONENT = re.compile(r"[eE][-+]?\d+")
+_EXACT_FLOAT_INT = 2 ** 53       # integers up to here survive a float round trip
+# Digit shapes: every digit → 9, or 1‑9 → 9 with zeros kept for leading‑zero handling
+_ALL_DIGITS = bytes.maketrans(b"0123456789", b"9999999999")
+_NONZERO_DIGITS = bytes.maketrans(b"123456789", b"999999999")
+
+def _parse(tokens: List[str]):
+    """Parse *tokens* into an ``array('d')`` (raises ``ValueError`` on bad input)."""
+    if np is not None:
+        return array("d", np.array(tokens, dtype=np.float64).tobytes())
+    return array("d", map(float, tokens))
+
+def _min_max(values: array):
+    if np is not None:
+        view = np.frombuffer(values, dtype=np.float64)
+        return float(view.min()), float(view.max())
+    return min(values), max(values)
+
+def _shapes(text: str, table: bytes) -> set:
+    return set(text.encode("ascii", "replace").translate(table).split(b"\n"))
+
+def _significant(shape: bytes) -> int:
+    """Significant digits of a ``_NONZERO_DIGITS`` shape (``900.90`` → 4)."""
+    whole, _, fraction = shape.lstrip(b"-+").partition(b".")
+    fraction = fraction.rstrip(b"0")
+    if not fraction:
+        # ``100000.0`` – trailing zeros of the integer part are not significant either
+        whole = whole.rstrip(b"0")
+    return len((whole + fraction).lstrip(b"0"))
+
+class NumericProfile:
+    """Accumulated statistics for all values observed for one numeric field."""
+
+    def __init__(self):
+        self.values = array("d")
+        self.rejected = 0            # tokens that were not numbers at all
+        self.integral = True         # every value written without fraction/exponent
+        self.int_min: Optional[int] = None
+        self.int_max: Optional[int] = None
+        self.max_fraction_digits = 0
+        self.max_significant_digits = 0   # upper bound while every token is short
+        self._min: Optional[float] = None
+        self._max: Optional[float] = None
+        self._moments = None
+
+    # ------------------------------------------------------------------
+    # Collection
+    # ------------------------------------------------------------------
+    def add_many(self, tokens: List[str]) -> None:
+        """Add a batch of raw string tokens."""
+        if not tokens:
+            return
+        joined = "\n".join(tokens)
+        parsed = None
+        if not joined.encode("ascii", "replace").translate(None, _NUMERIC_BYTES):
+            try:
+                parsed = _parse(tokens)
+            except ValueError:
+                pass
+        if parsed is None:
+            # Slow path – only taken for batches that contain stray tokens
+            tokens = [t for t in tokens if _NUMBER.fullmatch(t)]
+            self.rejected += len(joined.split("\n")) - len(tokens)
+            if not tokens:
+                return
+            joined = "\n".join(tokens)
+            parsed = _parse(tokens)
+
+        if self.integral and ("." in joined or "e" in joined or "E" in joined):
+            self.integral = False
+        lo, hi = _min_max(parsed)
+        if self.integral:
+            if -_EXACT_FLOAT_INT < lo and hi < _EXACT_FLOAT_INT:
+                ilo, ihi = int(lo), int(hi)
+            else:
+                # Beyond 2**53 only Python ints are exact
+                ints = list(map(int, tokens))
+                ilo, ihi = min(ints), max(ints)
+            self.int_min = ilo if self.int_min is None else min(self.int_min, ilo)
+            self.int_max = ihi if self.int_max is None else max(self.int_max, ihi)
+        self.values.extend(parsed)
+        self._min = lo if self._min is None else min(self._min, lo)
+        self._max = hi if self._max is None else max(self._max, hi)
+        self._moments = None
+        if self.integral:
+            return
+
+        # Precision: strip exponents, then measure the digit shapes of the mantissas
+        mantissas = _EXPONENT.sub("", joined) if "e" in joined or "E" in joined else joined
+        digits = 0
+        for shape in _shapes(mantissas, _ALL_DIGITS):
+            _, dot, fraction = shape.partition(b".")
+            self.max_fraction_digits = max(self.max_fraction_digits, len(fraction) if dot else 0)
+            digits = max(digits, shape.count(b"9"))
+        if digits > self.max_significant_digits:
+            # Leading and trailing zeros are not significant – only needed when the bound grows
+            digits = max(map(_significant, _shapes(mantissas, _NONZERO_DIGITS)))
+        self.max_significant_digits = max(self.max_significant_digits, digits)
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+    @property
+    def count(self) -> int:
+        return len(self.values)
+
+    @property
+    def minimum(self) -> float:
+        return self._min
+
+    @property
+    def maximum(self) -> float:
+        return self._max
+
+    @property
+    def negative(self) -> bool:
+        return self.count > 0 and self.minimum < 0
+
+    def _mean_stdev(self):
+        if self._moments is None:
+            if np is not None:
+                view = np.frombuffer(self.values, dtype=np.float64)
+                self._moments = (float(view.mean()), float(view.std()))
+            else:
+                n = self.count
+                mean = sum(self.values) / n
+                square_mean = sum(map(operator.mul, self.values, self.values)) / n
+                self._moments = (mean, max(square_mean - mean * mean, 0.0) ** 0.5)
+        return self._moments
+
+    @property
+    def mean(self) -> float:
+        return self._mean_stdev()[0]
+
+    @property
+    def stdev(self) -> float:
+        return self._mean_stdev()[1]
+
+    def outliers(self, sigma: float = OUTLIER_SIGMA) -> int:
+        """Number of values further than *sigma* standard deviations from the mean."""
+        if self.count < 2:
+            return 0
+        mean, spread = self.mean, sigma * self.stdev
+        low, high = mean - spread, mean + spread
+        if spread == 0 or (self.minimum >= low and self.maximum <= high):
+            return 0
+        if np is not None:
+            view = np.frombuffer(self.values, dtype=np.float64)
+            return int(np.count_nonzero((view < low) | (view > high)))
+        # One counting pass – ``low.__gt__`` and friends run at C speed
+        return sum(map(low.__gt__, self.values)) + sum(map(high.__lt__, self.values))
+
+    # ------------------------------------------------------------------
+    # Decision
+    # ------------------------------------------------------------------
+    def choose(self) -> Optional[str]:
+        """Return the narrowest DPL matcher that holds every observed value."""
+        if not self.count:
+            return None
+        if self.integral:
+            if INT32_MIN <= self.int_min and self.int_max <= INT32_MAX:
+                return "INT"
+            if INT64_MIN <= self.int_min and self.int_max <= INT64_MAX:
+                return "LONG"
+            return "DOUBLE"
+        magnitude = max(abs(self.minimum), abs(self.maximum))
+        if self.max_significant_digits <= FLOAT32_DIGITS and magnitude <= FLOAT32_MAX:
+            return "FLOAT"
+        return "DOUBLE"
+
+    def explain(self) -> List[str]:
+        """Human‑readable reasons behind :meth:`choose`."""
+        if not self.count:
+            return ["no numeric values observed"]
+        reasons = [f"{self.count} values, range [{self.minimum:g}, {self.maximum:g}]"]
+        reasons.append("signed" if self.negative else "never negative")
+        choice = self.choose()
+        if self.integral:
+            reasons.append("all values are integers")
+            if choice == "LONG":
+                reasons.append("range exceeds 32‑bit INT")
+            elif choice == "DOUBLE":
+                reasons.append("range exceeds 64‑bit LONG – stored lossily as DOUBLE")
+        else:
+            reasons.append(f"fractional values with up to {self.max_fraction_digits} decimal places")
+            if choice == "DOUBLE":
+                reasons.append(
+                    f"{self.max_significant_digits} significant digits exceed FLOAT precision ({FLOAT32_DIGITS})"
+                )
+        if self.rejected:
+            reasons.append(f"{self.rejected} non‑numeric tokens ignored – check the literal")
+        outliers = self.outliers()
+        if outliers:
+            reasons.append(f"{outliers} outliers beyond {OUTLIER_SIGMA:g}σ of the mean {self.mean:g}")
+        return reasons
+
+class NumericProfiler:
+    """Collect values for several numeric fields while streaming a corpus.
+
+    Parameters
+    ----------
+    fields: Dict[str, str]
+        Maps export name → literal that precedes the value in the log line.
+    """
+
+    def __init__(self, fields: Dict[str, str]):
+        self._extractors = {name: compile_value_extractor(lit) for name, lit in fields.items() if lit}
+        self._pending: Dict[str, List[str]] = {name: [] for name in self._extractors}
+        self.profiles = {name: NumericProfile() for name in self._extractors}
+
+    def add_line(self, line: str) -> None:
+        for name, extractor in self._extractors.items():
+            m = extractor.search(line)
+            if m:
+                pending = self._pending[name]
+                pending.append(m.group(1))
+                if len(pending) >= BATCH_SIZE:
+                    self._flush(name)
+
+    def _flush(self, name: str) -> None:
+        self.profiles[name].add_many(self._pending[name])
+        self._pending[name] = []
+
+    def results(self) -> Dict[str, NumericProfile]:
+        for name in self._extractors:
+            self._flush(name)
+        return self.profiles
+
+def profile_values(values: Iterable[str]) -> NumericProfile:
+    """Profile an iterable of raw string values for a single field."""
+    profile = NumericProfile()
+    values = iter(values)
+    while True:
+        batch = list(islice(values, BATCH_SIZE))
+        if not batch:
+            return profile
+        profile.add_many(batch)
@@ -4,12 +4,30 @@ The builder handles:
 * escaping single quotes inside literals,
 * automatically inserting ``SPACE?`` after literals that end with punctuation,
 * joining fragments with a single space.
+
+:func:`build_processing_rule` wraps the PARSE statement in a pipeline when
+other commands (such as masking steps) must run before or after it.
 """
 
-from typing import List
+from typing import List, Optional
 
 def build_parse_rule(fragments: List[str]) -> str:
     # Ensure each fragment is stripped and non‑empty
     cleaned = [frag.strip() for frag in fragments if frag.strip()]
     inner = " ".join(cleaned)
     return f'PARSE(content, "{inner}")'
+
+def build_processing_rule(
+    fragments: List[str],
+    before: Optional[List[str]] = None,
+    after: Optional[List[str]] = None,
+) -> str:
+    """Return ``cmd | … | PARSE(content, "...") | cmd | …``.
+
+    Without extra commands this is exactly :func:`build_parse_rule`.  Commands
+    that rewrite ``content`` need it declared with ``USING(INOUT content)``.
+    """
+    parse = build_parse_rule(fragments)
+    if not before and not after:
+        return parse
+    return " | ".join(["USING(INOUT content)", *(before or []), parse, *(after or [])])
@@ -0,0 +1,171 @@
+"""Persistent library of generated rules with fast "which rule matches" lookup.
+
+Every rule is indexed by its literal anchors (the quoted text in its ``LD``
+fragments – see :func:`rule_literals`).  A line can only match a rule if it
+contains all of that rule's anchors, so an Aho–Corasick scan over the line
+narrows thousands of rules down to a handful of candidates.  Candidates can
+then be confirmed with the local evaluator.
+
+The index is updated incrementally on :meth:`RuleLibrary.add`; on disk the
+library is a small JSON document and the index is rebuilt when it is loaded.
+Stored rules the local evaluator cannot compile (DPL beyond its subset) are
+skipped with a warning but kept, and written back when the library is saved.
+"""
+
+import json
+import os
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from dynatrace_rule_helper.engine.evaluator import CompiledRule
+from dynatrace_rule_helper.utils.aho_corasick import AhoCorasick
+
+LIBRARY_VERSION = 1
+
+class RuleLibrary:
+    """A collection of DPL rules indexed by their literal anchors.
+
+    Attributes
+    ----------
+    path: Optional[str]
+        File the library is saved to (``None`` for an in‑memory library).
+    rules: Dict[str, str]
+        Rule id → DPL rule string, in insertion order.
+    skipped: Dict[str, str]
+        Rule id → DPL rule string of loaded rules that could not be compiled;
+        they are not matched but are saved again.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.rules: Dict[str, str] = {}
+        self.skipped: Dict[str, str] = {}
+        self._by_rule: Dict[str, str] = {}              # rule text → id (deduplication)
+        self._compiled: Dict[str, CompiledRule] = {}
+        self._anchor_rules: Dict[str, List[str]] = {}   # inverted index: anchor → rule ids
+        self._anchor_count: Dict[str, int] = {}         # rule id → number of distinct anchors
+        self._unanchored: List[str] = []                # rules with no literal – always candidates
+        self._automaton = AhoCorasick()
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+    def add(self, rule: str, rule_id: Optional[str] = None) -> str:
+        """Add *rule* to the library and index it; returns its id.
+
+        Adding a rule that is already present returns the existing id.
+        """
+        rule = rule.strip()
+        if rule in self._by_rule:
+            return self._by_rule[rule]
+        compiled = CompiledRule(rule)
+        if rule_id is None:
+            n = len(self.rules) + 1
+            while f"rule-{n}" in self.rules or f"rule-{n}" in self.skipped:
+                n += 1
+            rule_id = f"rule-{n}"
+        elif rule_id in self.rules or rule_id in self.skipped:
+            raise ValueError(f"Rule id '{rule_id}' already exists in the library.")
+        self.rules[rule_id] = rule
+        self._by_rule[rule] = rule_id
+        self._compiled[rule_id] = compiled
+
+        anchors = set(compiled.literals)
+        self._anchor_count[rule_id] = len(anchors)
+        if not anchors:
+            self._unanchored.append(rule_id)
+        for anchor in anchors:
+            self._anchor_rules.setdefault(anchor, []).append(rule_id)
+            self._automaton.add(anchor)
+        return rule_id
+
+    def _add_stored(self, rule: str, rule_id: Optional[str] = None) -> None:
+        """Add a stored rule; one the evaluator cannot compile is skipped and kept."""
+        try:
+            self.add(rule, rule_id=rule_id)
+        except ValueError as exc:
+            if rule_id is None:
+                rule_id = f"skipped-{len(self.skipped) + 1}"
+            self.skipped[rule_id] = rule.strip()
+            print(f"Warning: rule {rule_id} skipped: {exc}", file=sys.stderr)
+
+    def compiled(self, rule_id: str) -> CompiledRule:
+        return self._compiled[rule_id]
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+    def candidates(self, line: str) -> List[str]:
+        """Return ids of rules whose every anchor occurs in *line*."""
+        hits: Dict[str, int] = {}
+        for anchor in self._automaton.search(line):
+            for rule_id in self._anchor_rules[anchor]:
+                hits[rule_id] = hits.get(rule_id, 0) + 1
+        anchor_count = self._anchor_count
+        found = [rule_id for rule_id, n in hits.items() if n == anchor_count[rule_id]]
+        return found + self._unanchored
+
+    def match(self, line: str, exact: bool = True) -> List[Tuple[str, Optional[Dict[str, str]]]]:
+        """Return ``(rule id, extracted fields)`` for rules covering *line*.
+
+        With ``exact=False`` only the anchor prefilter is applied and the fields
+        are ``None``.
+        """
+        if not exact:
+            return [(rule_id, None) for rule_id in self.candidates(line)]
+        result = []
+        for rule_id in self.candidates(line):
+            fields = self._compiled[rule_id].match(line)
+            if fields is not None:
+                result.append((rule_id, fields))
+        return result
+
+    def match_batch(self, lines: Iterable[str], exact: bool = True) -> List[List[Tuple[str, Optional[Dict[str, str]]]]]:
+        """:meth:`match` for every line of *lines*."""
+        return [self.match(line, exact=exact) for line in lines]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    @classmethod
+    def load(cls, path: str) -> "RuleLibrary":
+        """Load a library from *path*; a missing file yields an empty library."""
+        library = cls(path)
+        if not os.path.exists(path):
+            return library
+        try:
+            with open(path, "r", encoding="utf-8-sig") as f:
+                data = json.load(f)
+        except Exception as exc:
+            raise Exception(f"Failed to read rule library '{path}': {exc}")
+        for entry in data.get("rules", []):
+            library._add_stored(entry["rule"], rule_id=entry.get("id"))
+        return library
+
+    @classmethod
+    def from_rules(cls, rules: Iterable[str]) -> "RuleLibrary":
+        """Build an in‑memory library from plain rule strings."""
+        library = cls()
+        for rule in rules:
+            if rule.strip():
+                library._add_stored(rule)
+        return library
+
+    def save(self, path: Optional[str] = None) -> None:
+        path = path or self.path
+        if not path:
+            raise ValueError("No path given to save the rule library to.")
+        data = {
+            "version": LIBRARY_VERSION,
+            "rules": [
+                {"id": rule_id, "rule": rule}
+                for rules in (self.rules, self.skipped) for rule_id, rule in rules.items()
+            ],
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
@@ -0,0 +1,125 @@
+"""Representative sample selection from large log files.
+
+The file is read once.  Each line is assigned to a stratum by its shape
+signature (see :func:`line_shape`) and every stratum keeps a uniform
+reservoir of its lines (Algorithm R).  Memory is bounded by a budget of
+``max_strata × per_stratum`` lines no matter how large the input is: while
+few shapes have been seen each reservoir may use an equal share of the budget,
+and reservoirs are shrunk (by uniform subsampling) as new shapes appear, down
+to ``per_stratum``.  Once ``max_strata - 1`` shapes are tracked, new shapes
+share one overflow stratum.
+
+Selection walks the strata round‑robin, most frequent first, so the common
+case is always represented and rare variants follow before any stratum
+contributes a second sample; with few strata the larger reservoirs let the
+selection still fill up to the requested total.
+"""
+
+import random
+from typing import Dict, Iterable, List, Optional
+
+from dynatrace_rule_helper.utils.shape import line_shape
+
+OVERFLOW_SHAPE = "*"
+
+class Stratum:
+    """Line count and reservoir sample for one shape signature."""
+
+    def __init__(self, shape: str):
+        self.shape = shape
+        self.count = 0
+        self.reservoir: List[str] = []
+
+class Sample:
+    """A selected log line together with the stratum it represents."""
+
+    def __init__(self, content: str, shape: str, stratum_count: int):
+        self.content = content
+        self.shape = shape
+        self.stratum_count = stratum_count
+
+    def to_record(self) -> dict:
+        """Return a JSON record ready for ``process_log_file``."""
+        return {
+            "content": self.content,
+            "sample.shape": self.shape,
+            "sample.stratum_count": self.stratum_count,
+        }
+
+class StratifiedSampler:
+    """One‑pass, bounded‑memory stratified reservoir sampler.
+
+    Parameters
+    ----------
+    per_stratum: int
+        Reservoir size every shape is guaranteed; shapes keep more while
+        there are fewer than ``max_strata`` of them.
+    max_strata: int
+        Maximum number of distinct shapes tracked individually.
+    seed: Optional[int]
+        Seed for reproducible samples.
+    """
+
+    def __init__(self, per_stratum: int = 5, max_strata: int = 1000, seed: Optional[int] = None):
+        if per_stratum < 1 or max_strata < 1:
+            raise ValueError("per_stratum and max_strata must be positive.")
+        self.per_stratum = per_stratum
+        self.max_strata = max_strata
+        self.lines = 0
+        self.strata: Dict[str, Stratum] = {}
+        self._random = random.Random(seed)
+        self._budget = max_strata * per_stratum
+        self._capacity = self._budget       # current reservoir size per stratum
+
+    def add(self, line: str) -> None:
+        self.lines += 1
+        shape = line_shape(line)
+        stratum = self.strata.get(shape)
+        if stratum is None:
+            # The last slot is reserved for the shared overflow stratum
+            if len(self.strata) >= self.max_strata - 1:
+                shape = OVERFLOW_SHAPE
+                stratum = self.strata.get(shape)
+            if stratum is None:
+                stratum = self.strata[shape] = Stratum(shape)
+                self._shrink()
+        stratum.count += 1
+        if len(stratum.reservoir) < self._capacity:
+            stratum.reservoir.append(line)
+        else:
+            slot = self._random.randrange(stratum.count)
+            if slot < self._capacity:
+                stratum.reservoir[slot] = line
+
+    def _shrink(self) -> None:
+        """Give every stratum an equal share of the budget again."""
+        capacity = max(self.per_stratum, self._budget // len(self.strata))
+        if capacity >= self._capacity:
+            return
+        self._capacity = capacity
+        for stratum in self.strata.values():
+            if len(stratum.reservoir) > capacity:
+                # A uniform subset of a uniform sample is a uniform sample
+                stratum.reservoir = self._random.sample(stratum.reservoir, capacity)
+
+    def add_many(self, lines: Iterable[str]) -> "StratifiedSampler":
+        for line in lines:
+            self.add(line)
+        return self
+
+    def select(self, total: int = 50) -> List[Sample]:
+        """Pick up to *total* samples, one per stratum per round, most frequent first."""
+        ranked = sorted(self.strata.values(), key=lambda s: (-s.count, s.shape))
+        samples: List[Sample] = []
+        rounds = max((len(s.reservoir) for s in ranked), default=0)
+        for round_idx in range(rounds):
+            for stratum in ranked:
+                if len(samples) >= total:
+                    return samples
+                if round_idx < len(stratum.reservoir):
+                    samples.append(Sample(stratum.reservoir[round_idx], stratum.shape, stratum.count))
+        return samples
+
+def sample_log_lines(lines: Iterable[str], total: int = 50, **kwargs) -> List[Sample]:
+    """Stream *lines* once and return a stratified selection of *total* samples."""
+    return StratifiedSampler(**kwargs).add_many(lines).select(total)
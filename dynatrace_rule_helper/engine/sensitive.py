@@ -0,0 +1,290 @@
+"""Bulk detection of sensitive data (emails, IPs, card numbers, keys, tokens).
+
+Every detector declares a few *hints* – substrings one of which must occur
+for it to match (``@`` for emails, ``eyJ`` for JWTs, …).  Per line the hints
+are checked with plain ``in`` tests, and the detectors that remain are run as
+one combined regular expression of named alternatives, so a line is scanned
+with a single ``finditer`` however many detectors are enabled.  Combined
+patterns are compiled once per detector combination and cached.  Detectors
+whose patterns start alike share that *lead* in the combined pattern – as a
+common first element the regex engine can still skip quickly to candidate
+positions, which an alternation of separate branches prevents.  Matches that
+need a semantic check (IPv4 octets, the Luhn checksum of card numbers) are
+validated afterwards – only for the few candidates the regex found.
+
+Every hit is mapped to a DPL pattern that masks it.  Findings are aggregated
+by that pattern, so a corpus with millions of emails yields one finding (and
+one masking step) per detector; memory is bounded by ``max_findings``.
+"""
+
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Pattern, Tuple
+
+DEFAULT_MAX_FINDINGS = 256      # distinct masking patterns tracked
+
+_TOKEN_CHARS = r"[A-Za-z0-9_\-.]"
+# A digit that does not continue a number – the look‑behind follows the digit
+# so the pattern starts with a plain character class
+_NUMBER_START = r"[0-9](?<![0-9.][0-9])"
+
+def _valid_ipv4(value: str) -> bool:
+    return all(int(octet) <= 255 for octet in value.split("."))
+
+def _valid_card(value: str) -> bool:
+    digits = [int(c) for c in value if c.isdigit()]
+    # 13‑digit numbers are left alone: that is the length of epoch milliseconds
+    if not 14 <= len(digits) <= 19:
+        return False
+    # Luhn checksum – rejects the vast majority of random digit runs
+    total = 0
+    for idx, digit in enumerate(reversed(digits)):
+        if idx % 2:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        total += digit
+    return total % 10 == 0
+
+def _prefixed(prefix_len: int) -> Callable[[str, str], str]:
+    """DPL pattern for a token identified by its first *prefix_len* characters."""
+    def build(value: str, key: str) -> str:
+        return f"'{value[:prefix_len]}' {_TOKEN_CHARS}+"
+    return build
+
+def _api_key(value: str, key: str) -> str:
+    prefix = re.match(r"sk_live_|pk_live_|gh[pousr]_|AIza|dt0c01\.", value).group(0)
+    return f"'{prefix}' {_TOKEN_CHARS}+"
+
+def _card(value: str, key: str) -> str:
+    # DPL cannot check Luhn, so the mask keeps the observed digit grouping –
+    # a bare ``[0-9]{14,19}`` would also hit order ids and nanosecond timestamps
+    parts = re.split(r"([ \-])", value)
+    return " ".join(f"'{part}'" if part in (" ", "-") else f"[0-9]{{{len(part)}}}" for part in parts)
+
+def _credential(value: str, key: str) -> str:
+    literal = key.replace("'", "\\'")
+    if key.endswith(('"', "'")):
+        # JSON‑style ``"password": "..."`` – stop at the closing quote so it survives masking
+        return f"'{literal}' [^\"']+"
+    return f"'{literal}' SPACE? [^ ,;&]+"
+
+class Detector:
+    """One kind of sensitive value.
+
+    Attributes
+    ----------
+    name: str
+        Detector name, also the group name in the combined regex.
+    regex: str
+        Python pattern for a candidate.  A group named ``value`` marks the
+        sensitive part when the match also covers a key (``password=...``).
+    dpl: Callable[[str, str], str]
+        Returns the DPL pattern matching the hit, given the sensitive value and
+        the key text in front of it.
+    validate: Optional[Callable[[str], bool]]
+        Extra check applied to the sensitive value.
+    hints: Tuple[str, ...]
+        The detector only runs on lines containing one of these substrings
+        (all lines when empty).
+    ignore_case: bool
+        Check *hints* against the lower‑cased line.
+    lead: str
+        Pattern prefix shared with other detectors; *regex* continues after it.
+    """
+
+    def __init__(self, name: str, regex: str, dpl: Callable[[str, str], str],
+                 validate: Optional[Callable[[str], bool]] = None,
+                 hints: Tuple[str, ...] = (), ignore_case: bool = False, lead: str = ""):
+        self.name = name
+        self.regex = regex
+        self.dpl = dpl
+        self.validate = validate
+        self.hints = hints
+        self.ignore_case = ignore_case
+        self.lead = lead
+
+DETECTORS = [
+    Detector(
+        "credential",
+        # ``access_token``, ``AWS_SECRET_ACCESS_KEY`` – the keyword may follow a prefix
+        r"(?i:(?<![A-Za-z0-9])(?:[\w\-]*[_\-])?(?:password|passwd|pwd|secret|token|api[_\-]?key|access[_\-]?key)[\"']?\s*[=:]\s*[\"']?)"
+        r"(?P<value>[^\s,;&\"']+)",
+        _credential,
+        hints=("pass", "pwd", "secret", "token", "key"),
+        ignore_case=True,
+    ),
+    Detector(
+        "email",
+        r"[A-Za-z0-9._%+\-]+@[A-Za-z0-9\-]+(?:\.[A-Za-z0-9\-]+)*\.[A-Za-z]{2,}",
+        lambda value, key: "[A-Za-z0-9._%+\\-]+ '@' [A-Za-z0-9.\\-]+",
+        hints=("@",),
+    ),
+    Detector(
+        "jwt",
+        r"\beyJ[A-Za-z0-9_\-]+\.[A-Za-z0-9_\-]+\.[A-Za-z0-9_\-]*",
+        _prefixed(3),
+        hints=("eyJ",),
+    ),
+    Detector(
+        "bearer",
+        r"\bBearer\s+[A-Za-z0-9_\-.~+/]+=*",
+        lambda value, key: "'Bearer' SPACE [A-Za-z0-9_\\-.~+/=]+",
+        hints=("Bearer",),
+    ),
+    Detector(
+        "aws_key",
+        r"\b(?:AKIA|ASIA)[0-9A-Z]{16}\b",
+        lambda value, key: "[A-Z]{4} [0-9A-Z]{16}",
+        hints=("AKIA", "ASIA"),
+    ),
+    Detector(
+        "api_key",
+        r"\b(?:sk_live_|pk_live_|gh[pousr]_|AIza|dt0c01\.)[A-Za-z0-9_\-.]{16,}",
+        _api_key,
+        hints=("_live_", "gh", "AIza", "dt0c01."),
+    ),
+    Detector(
+        "credit_card",
+        r"(?:[ \-]?[0-9]){13,18}(?![0-9.])",
+        _card,
+        _valid_card,
+        lead=_NUMBER_START,
+    ),
+    Detector(
+        "ipv4",
+        r"[0-9]{0,2}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}(?![0-9.])",
+        lambda value, key: "IPADDR",
+        _valid_ipv4,
+        hints=(".",),
+        lead=_NUMBER_START,
+    ),
+]
+
+class Hit:
+    """A sensitive value found in one line."""
+
+    def __init__(self, detector: str, start: int, end: int, key: str, value: str, pattern: str):
+        self.detector = detector
+        self.start = start          # span of the whole match, key included
+        self.end = end
+        self.key = key
+        self.value = value
+        self.pattern = pattern
+
+class Finding:
+    """All hits that are masked by the same DPL pattern."""
+
+    def __init__(self, detector: str, pattern: str, key: str, example: str):
+        self.detector = detector
+        self.pattern = pattern
+        self.key = key              # text the pattern consumes before the value
+        self.example = example      # redacted – reports must not leak the data
+        self.count = 0
+
+def redact(value: str) -> str:
+    return value[:2] + "…" if len(value) > 4 else "…"
+
+class SensitiveScanner:
+    """Streaming scanner that aggregates sensitive‑data findings.
+
+    Parameters
+    ----------
+    detectors: Optional[Iterable[Detector]]
+        Detectors to run (default: :data:`DETECTORS`).  Earlier detectors win
+        when candidates overlap.
+    max_findings: int
+        Maximum number of distinct masking patterns kept.
+    """
+
+    def __init__(self, detectors: Optional[Iterable[Detector]] = None,
+                 max_findings: int = DEFAULT_MAX_FINDINGS):
+        self.detectors: Dict[str, Detector] = {d.name: d for d in (detectors or DETECTORS)}
+        self.max_findings = max_findings
+        self.lines = 0
+        self.findings: Dict[str, Finding] = {}
+        self._keyed = {d.name for d in self.detectors.values() if "(?P<value>" in d.regex}
+        self._always = tuple(d.name for d in self.detectors.values() if not d.hints)
+        self._hinted = [(d.name, d.hints) for d in self.detectors.values() if d.hints and not d.ignore_case]
+        self._hinted_lower = [(d.name, d.hints) for d in self.detectors.values() if d.hints and d.ignore_case]
+        self._compiled: Dict[Tuple[str, ...], Optional[Pattern]] = {}
+
+    def _combined(self, names: Tuple[str, ...]) -> Optional[Pattern]:
+        """Compile (and cache) one regex with an alternative per detector in *names*."""
+        regex = self._compiled.get(names, False)
+        if regex is False:
+            # Alternatives grouped by lead, in detector order of the first member
+            by_lead: Dict[str, List[str]] = {}
+            for name, detector in self.detectors.items():
+                if name in names:
+                    # ``value`` groups are renamed per detector to keep group names unique
+                    body = detector.regex.replace("(?P<value>", f"(?P<{name}__value>")
+                    by_lead.setdefault(detector.lead, []).append(f"(?P<{name}>{body})")
+            alternatives = [
+                f"{lead}(?:{'|'.join(bodies)})" if lead else "|".join(bodies)
+                for lead, bodies in by_lead.items()
+            ]
+            regex = self._compiled[names] = re.compile("|".join(alternatives)) if alternatives else None
+        return regex
+
+    def _active(self, line: str) -> Tuple[str, ...]:
+        active = list(self._always)
+        for name, hints in self._hinted:
+            for hint in hints:
+                if hint in line:
+                    active.append(name)
+                    break
+        if self._hinted_lower:
+            lowered = line.lower()
+            for name, hints in self._hinted_lower:
+                for hint in hints:
+                    if hint in lowered:
+                        active.append(name)
+                        break
+        return tuple(active)
+
+    def scan(self, line: str) -> List[Hit]:
+        """Return the validated hits in *line* without recording them."""
+        hits = []
+        regex = self._combined(self._active(line))
+        if regex is None:
+            return hits
+        for m in regex.finditer(line):
+            name = m.lastgroup
+            detector = self.detectors[name]
+            if name in self._keyed:
+                group = f"{name}__value"
+                key = line[m.start():m.start(group)].rstrip()
+                value = m.group(group)
+            else:
+                key, value = "", m.group()
+            if detector.validate and not detector.validate(value):
+                continue
+            hits.append(Hit(name, m.start(), m.end(), key, value, detector.dpl(value, key)))
+        return hits
+
+    def add_line(self, line: str) -> List[Hit]:
+        """Scan *line* and record its hits in :attr:`findings`."""
+        self.lines += 1
+        hits = self.scan(line)
+        findings = self.findings
+        for hit in hits:
+            finding = findings.get(hit.pattern)
+            if finding is None:
+                if len(findings) >= self.max_findings:
+                    continue
+                finding = findings[hit.pattern] = Finding(hit.detector, hit.pattern, hit.key, redact(hit.value))
+            finding.count += 1
+        return hits
+
+    def add_many(self, lines: Iterable[str]) -> "SensitiveScanner":
+        for line in lines:
+            self.add_line(line)
+        return self
+
+    def ranked(self) -> List[Finding]:
+        """Findings ordered by number of hits, most frequent first."""
+        return sorted(self.findings.values(), key=lambda f: (-f.count, f.detector, f.pattern))
+
+def scan_sensitive(lines: Iterable[str], **kwargs) -> List[Finding]:
+    """Stream *lines* once and return the aggregated findings."""
+    return SensitiveScanner(**kwargs).add_many(lines).ranked()
@@ -4,21 +4,29 @@ from .base import BaseMatcher
 from .timestamp import TimestampMatcher
 from .ld import LDMatcher
 from .int import IntMatcher
+from .long import LongMatcher
 from .float import FloatMatcher
+from .double import DoubleMatcher
 from .string import StringMatcher
 from .ipaddr import IPAddrMatcher
 from .url import URLMatcher
 from .json_matcher import JSONMatcher
-# Future: EnumMatcher, RegexMatcher, etc.
+from .enum import EnumMatcher
+from .mask import MaskMatcher
+# Future: RegexMatcher, etc.
 
 __all__ = [
     "BaseMatcher",
     "TimestampMatcher",
     "LDMatcher",
     "IntMatcher",
+    "LongMatcher",
     "FloatMatcher",
+    "DoubleMatcher",
     "StringMatcher",
     "IPAddrMatcher",
     "URLMatcher",
     "JSONMatcher",
+    "EnumMatcher",
+    "MaskMatcher",
 ]
@@ -0,0 +1,11 @@
+from .base import BaseMatcher
+
+class DoubleMatcher(BaseMatcher):
+    def __init__(self, export_name: str, literal: str = None):
+        super().__init__(export_name, literal)
+
+    def build(self) -> str:
+        if self.literal:
+            escaped = self.literal.replace("'", "\\'")
+            return f"LD '{escaped}' SPACE? DOUBLE:{self.export_name}"
+        return f"DOUBLE:{self.export_name}"
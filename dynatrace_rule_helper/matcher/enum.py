@@ -0,0 +1,26 @@
+from typing import Dict
+
+from .base import BaseMatcher
+
+class EnumMatcher(BaseMatcher):
+    """Matcher for a closed set of string values mapped to integer ids.
+
+    The DPL syntax is ``ENUM('INFO':0,'WARN':1):export`` – the matched token is
+    stored as its numeric id, which is cheaper to evaluate and store than a
+    generic ``STRING``.
+    """
+
+    def __init__(self, export_name: str, mapping: Dict[str, int], literal: str = None):
+        super().__init__(export_name, literal)
+        if not mapping:
+            raise ValueError("EnumMatcher requires at least one enum value.")
+        self.mapping = mapping
+
+    def build(self) -> str:
+        entries = ",".join(
+            "'" + key.replace("'", "\\'") + f"':{val}" for key, val in self.mapping.items()
+        )
+        if self.literal:
+            escaped = self.literal.replace("'", "\\'")
+            return f"LD '{escaped}' SPACE? ENUM({entries}):{self.export_name}"
+        return f"ENUM({entries}):{self.export_name}"
@@ -0,0 +1,23 @@
+from .base import BaseMatcher
+
+class MaskMatcher(BaseMatcher):
+    """Processing step that masks (or drops) sensitive values in a field.
+
+    DPL has no masking matcher inside ``PARSE``; masking is a
+    ``FIELDS_ADD(field: replacePattern(field, "pattern", "replacement"))``
+    command placed in the rule's pipeline.  *pattern* is a DPL pattern; when
+    it starts with the literal *key* (``'password='``) the key is kept in the
+    replacement so only the value disappears.
+    """
+
+    def __init__(self, pattern: str, key: str = "", drop: bool = False, export_name: str = "content"):
+        super().__init__(export_name)
+        self.pattern = pattern
+        self.key = key
+        self.drop = drop
+
+    def build(self) -> str:
+        replacement = self.key + ("" if self.drop else "***")
+        pattern = self.pattern.replace('"', '\\"')
+        replacement = replacement.replace('"', '\\"')
+        return f'FIELDS_ADD({self.export_name}: replacePattern({self.export_name}, "{pattern}", "{replacement}"))'
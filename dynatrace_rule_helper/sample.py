@@ -0,0 +1,56 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from dynatrace_rule_helper.engine.multiline import assemble_records
+from dynatrace_rule_helper.engine.sampling import StratifiedSampler
+from dynatrace_rule_helper.utils.file_io import iter_log_lines
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        description="Pick representative sample log lines from a large log file in one pass.")
+    parser.add_argument("-f", "--file", required=True,
+                        help="Log file – JSON lines with a 'content' field or plain text ('-' for stdin).")
+    parser.add_argument("-n", "--samples", type=int, default=50,
+                        help="Number of samples to select (default: 50).")
+    parser.add_argument("--per-stratum", type=int, default=5,
+                        help="Reservoir size kept for every line shape (default: 5).")
+    parser.add_argument("--max-strata", type=int, default=1000,
+                        help="Maximum number of distinct line shapes tracked (default: 1000).")
+    parser.add_argument("--seed", type=int,
+                        help="Random seed for reproducible samples.")
+    parser.add_argument("--multiline", action="store_true",
+                        help="Sample whole multiline records (stack traces) instead of single lines.")
+    parser.add_argument("--out-dir",
+                        help="Write one JSON file per sample (usable with --file) instead of JSON lines on stdout.")
+    return parser.parse_args()
+
+def main():
+    args = parse_arguments()
+    try:
+        sampler = StratifiedSampler(per_stratum=args.per_stratum, max_strata=args.max_strata, seed=args.seed)
+        lines = iter_log_lines(args.file)
+        if args.multiline:
+            lines = assemble_records(lines)
+        sampler.add_many(lines)
+        samples = sampler.select(args.samples)
+        if args.out_dir:
+            out_dir = Path(args.out_dir)
+            out_dir.mkdir(parents=True, exist_ok=True)
+            for idx, sample in enumerate(samples, 1):
+                with open(out_dir / f"sample_{idx:03d}.json", "w", encoding="utf-8") as f:
+                    json.dump(sample.to_record(), f, indent=2)
+        else:
+            for sample in samples:
+                print(json.dumps(sample.to_record()))
+        covered = len({sample.shape for sample in samples})
+        unit = "records" if args.multiline else "lines"
+        print(f"{sampler.lines} {unit}, {len(sampler.strata)} line shapes, {covered} covered by {len(samples)} samples.",
+              file=sys.stderr)
+    except Exception as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import argparse
+import sys
+
+from dynatrace_rule_helper.engine.simulator import load_rule_set, simulate
+from dynatrace_rule_helper.utils.file_io import iter_log_lines
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        description="Run a log stream through a rule set and report throughput and per‑rule cost.")
+    parser.add_argument("-r", "--rules", required=True,
+                        help="Rule library JSON (see --library) or a text file with one PARSE rule per line.")
+    parser.add_argument("-f", "--file", required=True,
+                        help="Log stream to replay – JSON lines with a 'content' field or plain text ('-' for stdin).")
+    parser.add_argument("--top", type=int, default=20,
+                        help="Number of most expensive rules to list (default: 20).")
+    return parser.parse_args()
+
+def main():
+    args = parse_arguments()
+    try:
+        library = load_rule_set(args.rules)
+        report = simulate(library, iter_log_lines(args.file))
+        print(report.format(top=args.top))
+    except Exception as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
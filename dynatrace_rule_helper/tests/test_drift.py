@@ -0,0 +1,86 @@
+# Dynatrace Rule Helper – format drift detection tests
+
+from dynatrace_rule_helper.engine.drift import DriftMonitor
+from dynatrace_rule_helper.utils.shape import line_shape
+
+RULE = "PARSE(content, \"LD 'Billed Duration:' SPACE? INT:billed LD 'Memory:' SPACE? INT?:memory\")"
+
+def run(monitor, lines):
+    alerts = []
+    for line in lines:
+        alerts.extend(monitor.feed(line))
+    return alerts + monitor.flush()
+
+def test_stable_format_raises_no_alerts():
+    monitor = DriftMonitor(RULE, window=100)
+    lines = [f"REPORT Billed Duration: {i} ms Memory: {i * 2} MB" for i in range(1_000)]
+    assert run(monitor, lines) == []
+    assert monitor.windows == 10
+
+def test_format_change_raises_match_and_shape_alerts():
+    monitor = DriftMonitor(RULE, window=100)
+    old = [f"REPORT Billed Duration: {i} ms Memory: {i} MB" for i in range(300)]
+    new = [f"REPORT billed_duration_ms={i} memory_mb={i}" for i in range(200)]
+    kinds = [(alert.kind, alert.window) for alert in run(monitor, old + new)]
+    assert kinds == [("match_rate", 4), ("new_shapes", 4), ("match_rate", 5)]
+
+def test_optional_field_drop_is_reported():
+    monitor = DriftMonitor(RULE, window=100)
+    old = [f"REPORT Billed Duration: {i} ms Memory: {i} MB" for i in range(100)]
+    new = [f"REPORT Billed Duration: {i} ms Memory: n/a" for i in range(100)]
+    alerts = run(monitor, old + new)
+    assert [alert.kind for alert in alerts] == ["field_rate", "new_shapes"]
+    assert "'memory'" in str(alerts[0])
+
+def marks(n):
+    # A distinct run of punctuation – and so a distinct shape – per n
+    word = ""
+    while True:
+        n, rest = divmod(n, 16)
+        word += "!#$%&*+-./;<=>?@"[rest]
+        if not n:
+            return word
+
+def test_new_shapes_are_still_reported_after_many_distinct_shapes():
+    monitor = DriftMonitor(RULE, window=1_000, max_known_shapes=20_000)
+    # 60k distinct shapes – enough to saturate any fixed‑size sketch
+    run(monitor, [f"{marks(i)} Billed Duration: 1 ms" for i in range(60_000)])
+    assert len(monitor.known_shapes) <= 20_000
+    fresh = [f"{marks(i)} Billed Duration: 1 ms" for i in range(100_000, 101_000)]
+    assert [alert.kind for alert in run(monitor, fresh)] == ["new_shapes"]
+
+def test_unseen_shapes_expire():
+    monitor = DriftMonitor(RULE, window=10, shape_ttl=3)
+    run(monitor, ["REPORT Billed Duration: 1 ms"] * 10 + ["Billed Duration: 2 ms"] * 50)
+    assert list(monitor.known_shapes) == [line_shape("Billed Duration: 2 ms")]
+
+def test_baseline_follows_slow_changes():
+    monitor = DriftMonitor(RULE, window=100, match_drop=0.10, baseline_alpha=0.5)
+    lines = []
+    for step in range(10):
+        # Match rate falls by 5 points per window – never 10 below the rolling baseline
+        matched = 100 - 5 * step
+        lines += [f"REPORT Billed Duration: {i} ms Memory: 1 MB" for i in range(matched)]
+        lines += [f"REPORT timeout after {i} ms" for i in range(100 - matched)]
+    assert [alert.kind for alert in run(monitor, lines)] == ["new_shapes"]
+    assert 0.5 < monitor.baseline_rate < 0.65
+
+def test_windows_also_close_on_elapsed_time():
+    now = [0.0]
+    monitor = DriftMonitor(RULE, window_seconds=60, clock=lambda: now[0])
+    for i in range(30):
+        assert monitor.feed(f"REPORT Billed Duration: {i} ms Memory: 1 MB") == []
+    now[0] = 61.0
+    assert monitor.tick() == [] and monitor.windows == 1
+    # Too few lines for a verdict – the window stays open past its time
+    alerts = [alert for i in range(10) for alert in monitor.feed(f"REPORT timeout after {i} ms")]
+    now[0] = 130.0
+    assert alerts + monitor.tick() == []
+    alerts = [alert for i in range(10) for alert in monitor.feed(f"REPORT timeout after {i} ms")]
+    assert [(alert.kind, alert.window) for alert in alerts] == [("match_rate", 2), ("new_shapes", 2)]
+
+def test_tiny_final_window_is_not_judged():
+    monitor = DriftMonitor(RULE, window=100)
+    lines = [f"REPORT Billed Duration: {i} ms Memory: 1 MB" for i in range(100)]
+    assert run(monitor, lines + ["REPORT timeout after 5 ms"] * 3) == []
+    assert monitor.windows == 1
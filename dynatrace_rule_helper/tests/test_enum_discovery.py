@@ -0,0 +1,74 @@
+# Dynatrace Rule Helper – enum discovery tests
+
+import json
+import pathlib
+
+from dynatrace_rule_helper.engine.core import process_log_file
+from dynatrace_rule_helper.engine.enum_discovery import discover_enums
+from dynatrace_rule_helper.engine.evaluator import CompiledRule
+from dynatrace_rule_helper.matcher.enum import EnumMatcher
+
+FIXTURE_DIR = pathlib.Path(__file__).parent / "fixtures"
+
+def test_low_cardinality_field_becomes_enum():
+    lines = [f"req={i} method: {m} user={i * 7}" for i, m in enumerate(["GET", "GET", "POST", "PUT"] * 50)]
+    mappings = discover_enums(lines, {"http.method": "method:", "user": "user="})
+    assert mappings == {"http.method": {"GET": 0, "POST": 1, "PUT": 2}}
+
+def test_enum_matcher_build_escapes_quotes():
+    matcher = EnumMatcher(export_name="state", mapping={"OK": 0, "it's": 1}, literal="state=")
+    assert matcher.build() == "LD 'state=' SPACE? ENUM('OK':0,'it\\'s':1):state"
+
+def test_corpus_turns_string_into_enum(tmp_path):
+    corpus = tmp_path / "corpus.jsonl"
+    levels = ["INFO"] * 80 + ["WARN"] * 15 + ["ERROR"] * 5
+    corpus.write_text("\n".join(json.dumps({"content": f"level: {lvl} id={i}"}) for i, lvl in enumerate(levels)))
+    sample = tmp_path / "sample.json"
+    sample.write_text(json.dumps({"content": "level: INFO id=1"}))
+    rule = process_log_file(
+        file_path=str(sample),
+        literals="level:",
+        values="INFO",
+        aliases="level",
+        corpus_file=str(corpus),
+    )
+    assert rule == "PARSE(content, \"LD 'level:' SPACE? ENUM('INFO':0,'WARN':1,'ERROR':2):level\")"
+
+def test_enum_file_mapping_is_used(tmp_path):
+    enum_file = tmp_path / "enums.json"
+    enum_file.write_text(json.dumps({"loglevel": {"INFO": 0, "WARN": 1}}))
+    rule = process_log_file(
+        file_path=str(FIXTURE_DIR / "example2.json"),
+        literals="REPORT",
+        values="",
+        matcher_types="ENUM",
+        aliases="loglevel",
+        enum_file=str(enum_file),
+    )
+    assert "LD 'REPORT' SPACE? ENUM('INFO':0,'WARN':1):loglevel" in rule
+
+def test_rare_values_are_part_of_the_enum():
+    levels = ["INFO"] * 50_000 + ["WARN"] * 4_000 + ["ERROR"] * 30 + ["FATAL"] * 20
+    mappings = discover_enums((f"level: {lvl}" for lvl in levels), {"level": "level:"})
+    assert mappings == {"level": {"INFO": 0, "WARN": 1, "ERROR": 2, "FATAL": 3}}
+
+def test_constant_and_unrepeated_fields_stay_strings():
+    lines = [f"path=/x user=u{i % 15} level: {'INFO' if i % 3 else 'WARN'}" for i in range(60)]
+    mappings = discover_enums(lines, {"path": "path=", "user": "user=", "level": "level:"})
+    assert mappings == {"level": {"INFO": 0, "WARN": 1}}
+
+def test_sample_value_is_part_of_the_enum(tmp_path):
+    corpus = tmp_path / "corpus.jsonl"
+    levels = ["INFO"] * 80 + ["WARN"] * 20
+    corpus.write_text("\n".join(json.dumps({"content": f"level: {lvl} id={i}"}) for i, lvl in enumerate(levels)))
+    sample = tmp_path / "sample.json"
+    sample.write_text(json.dumps({"content": "level: DEBUG id=1"}))
+    rule = process_log_file(
+        file_path=str(sample),
+        literals="level:",
+        values="DEBUG",
+        aliases="level",
+        corpus_file=str(corpus),
+    )
+    assert rule == "PARSE(content, \"LD 'level:' SPACE? ENUM('INFO':0,'WARN':1,'DEBUG':2):level\")"
+    assert CompiledRule(rule).match("level: DEBUG id=1") is not None
@@ -0,0 +1,76 @@
+# Dynatrace Rule Helper – multiline record assembly tests
+
+import json
+
+from dynatrace_rule_helper.engine.core import process_log_file
+from dynatrace_rule_helper.engine.multiline import RecordAssembler, assemble_records
+
+JAVA = [
+    "2024-01-01 12:00:03 ERROR Request failed id=7",
+    "java.lang.IllegalStateException: boom",
+    "    at com.example.Service.handle(Service.java:42)",
+    "Caused by: java.io.IOException: disk full",
+    "    ... 12 more",
+    "2024-01-01 12:00:04 INFO ok id=8",
+]
+
+def test_stack_trace_is_joined_to_its_timestamped_line():
+    assembler = RecordAssembler()
+    records = list(assemble_records(JAVA, assembler))
+    assert records == ["\n".join(JAVA[:5]), JAVA[5]]
+    assert assembler.start_format == "yyyy-MM-dd HH:mm:ss"
+
+def test_python_traceback_without_timestamps():
+    lines = [
+        "ERROR:root:boom happened",
+        "Traceback (most recent call last):",
+        '  File "app.py", line 3, in <module>',
+        "ValueError: bad input",
+        "INFO:root:fine",
+    ]
+    assert list(assemble_records(lines)) == ["\n".join(lines[:4]), lines[4]]
+
+def test_oversized_records_are_truncated():
+    lines = ["2024-01-01 12:00:00 ERROR x"] + [f"    at frame{i}" for i in range(100)] + ["2024-01-01 12:00:01 INFO y"]
+    assembler = RecordAssembler(learn_lines=10, max_lines=5)
+    records = list(assemble_records(lines, assembler))
+    assert [record.count("\n") + 1 for record in records] == [5, 1]
+    assert assembler.truncated == 1
+
+def test_corpus_records_feed_inference(tmp_path):
+    corpus = tmp_path / "corpus.log"
+    events = []
+    for i in range(60):
+        level = ["INFO", "WARN", "ERROR"][i % 3]
+        events.append(f"2024-01-01 12:00:{i % 60:02d} level: {level} took {i} ms")
+        if level == "ERROR":
+            events += ["java.lang.RuntimeException: failed", "    at com.example.Job.run(Job.java:12)"]
+    corpus.write_text("\n".join(events))
+    sample = tmp_path / "sample.json"
+    sample.write_text(json.dumps({"content": "2024-01-01 12:00:00 level: INFO took 5 ms"}))
+    rule = process_log_file(
+        file_path=str(sample),
+        literals="level:",
+        values="INFO",
+        aliases="level",
+        corpus_file=str(corpus),
+        multiline=True,
+    )
+    # The sample line counts too, so INFO is the most frequent value
+    assert "ENUM('INFO':0,'ERROR':1,'WARN':2):level" in rule
+
+def test_rare_timestamp_prefix_is_not_learned():
+    lines = [f"INFO request {i} ok" for i in range(2_000)]
+    lines.insert(500, "12:00:01 INFO clock line")
+    assembler = RecordAssembler()
+    records = list(assemble_records(lines, assembler))
+    assert assembler.start_format is None
+    assert len(records) == len(lines) and assembler.truncated == 0
+
+def test_space_padded_syslog_days_start_records():
+    lines = [f"Jan 31 00:00:{i % 60:02d} host sshd[1]: Accepted {i}" for i in range(1_000)]
+    lines += [f"Feb  1 00:00:{i % 60:02d} host sshd[1]: Accepted {i}" for i in range(1_000)]
+    assembler = RecordAssembler()
+    records = list(assemble_records(lines, assembler))
+    assert assembler.start_format == "MMM d HH:mm:ss"
+    assert len(records) == 2_000 and assembler.truncated == 0
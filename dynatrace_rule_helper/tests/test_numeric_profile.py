@@ -0,0 +1,69 @@
+# Dynatrace Rule Helper – numeric profiling tests
+
+import json
+
+from dynatrace_rule_helper.engine.core import process_log_file
+from dynatrace_rule_helper.engine.evaluator import CompiledRule
+from dynatrace_rule_helper.engine.numeric_profile import profile_values
+
+def test_mixed_int_and_float_values_choose_float():
+    profile = profile_values(["12", "12.5", "-3"])
+    assert profile.choose() == "FLOAT"
+    assert profile.negative
+    assert profile.max_fraction_digits == 1
+
+def test_integer_ranges_pick_narrowest_type():
+    assert profile_values(["1", "2147483647"]).choose() == "INT"
+    assert profile_values(["1", "2147483648"]).choose() == "LONG"
+    assert profile_values(["1", str(2 ** 64)]).choose() == "DOUBLE"
+
+def test_high_precision_fraction_needs_double():
+    profile = profile_values(["0.5", "3.14159265358"])
+    assert profile.choose() == "DOUBLE"
+    assert any("significant digits" in reason for reason in profile.explain())
+
+def test_non_numeric_tokens_are_reported():
+    profile = profile_values(["10", "n/a", "20"])
+    assert profile.choose() == "INT"
+    assert profile.rejected == 1
+
+def test_corpus_overrides_single_sample_guess(tmp_path):
+    corpus = tmp_path / "corpus.log"
+    corpus.write_text("\n".join(f"Duration: {d} ms" for d in ["12", "12.5", "7"] * 10))
+    sample = tmp_path / "sample.json"
+    sample.write_text(json.dumps({"content": "Duration: 12 ms"}))
+    rule = process_log_file(
+        file_path=str(sample),
+        values="12",
+        aliases="duration",
+        corpus_file=str(corpus),
+    )
+    assert "LD 'Duration:' SPACE? FLOAT:duration" in rule
+
+def test_float_keeps_only_six_significant_digits():
+    # 7 significant digits do not round‑trip through float32 (FLT_DIG is 6)
+    assert profile_values(["8589973000.0", "8589974000.0"]).choose() == "DOUBLE"
+    assert profile_values(["85899.5", "0.000123"]).choose() == "FLOAT"
+
+def test_outliers_are_counted():
+    values = [str(v % 10 + 0.5) for v in range(10_000)] + ["1e6", "-1e6"]
+    assert profile_values(values).outliers() == 2
+
+def test_trailing_zeros_are_not_significant():
+    assert profile_values(["100000.0", "2.5"]).choose() == "FLOAT"
+    assert profile_values(["1.50"]).max_significant_digits == 2
+
+def test_rule_matches_its_own_sample(tmp_path):
+    corpus = tmp_path / "corpus.log"
+    corpus.write_text("\n".join(f"took {i}" for i in range(40)))
+    sample = tmp_path / "sample.json"
+    sample.write_text(json.dumps({"content": "took 3000000000"}))
+    rule = process_log_file(
+        file_path=str(sample),
+        literals="took",
+        values="3000000000",
+        aliases="took",
+        corpus_file=str(corpus),
+    )
+    assert "LONG:took" in rule
+    assert CompiledRule(rule).match("took 3000000000") is not None
@@ -0,0 +1,92 @@
+# Dynatrace Rule Helper – rule library & evaluator tests
+
+import json
+import sys
+
+import pytest
+
+from dynatrace_rule_helper import cli
+from dynatrace_rule_helper.engine.evaluator import compile_rule, rule_literals
+from dynatrace_rule_helper.engine.rule_library import RuleLibrary
+from dynatrace_rule_helper.utils.aho_corasick import AhoCorasick
+
+BILLED = "PARSE(content, \"LD 'Billed Duration:' SPACE? INT:aws.billed.duration\")"
+LEVEL = "PARSE(content, \"LD 'level:' SPACE? ENUM('INFO':0,'WARN':1):level\")"
+TWO_ANCHORS = "PARSE(content, \"LD 'JobName:' SPACE? STRING:job LD 'Failure:' SPACE? STRING:failure\")"
+
+def test_aho_corasick_finds_overlapping_patterns():
+    automaton = AhoCorasick(["he", "she", "hers", "his"])
+    assert automaton.search("ushers") == {"he", "she", "hers"}
+    automaton.add("us")
+    assert automaton.search("ushers") == {"us", "he", "she", "hers"}
+
+def test_evaluator_extracts_fields():
+    rule = compile_rule(BILLED)
+    assert rule.match("REPORT Duration: 5033.50 ms\tBilled Duration: 5034 ms") == {"aws.billed.duration": "5034"}
+    assert rule.match("Billed Duration: n/a") is None
+    assert compile_rule(LEVEL).match("ts level: WARN x") == {"level": "WARN"}
+
+def test_rule_literals_skip_matcher_arguments():
+    assert rule_literals(LEVEL) == ["level:"]
+    with pytest.raises(ValueError):
+        compile_rule("PARSE(content, \"NOPE:x\")")
+
+def test_library_candidates_require_all_anchors():
+    library = RuleLibrary.from_rules([BILLED, LEVEL, TWO_ANCHORS])
+    line = "CSV file generation error, JobName: ABCD1234, Failure: Failed"
+    assert library.candidates("JobName: only") == []
+    assert library.candidates(line) == ["rule-3"]
+    assert library.match(line) == [("rule-3", {"job": "ABCD1234,", "failure": "Failed"})]
+
+def test_library_persists_and_updates_incrementally(tmp_path):
+    path = str(tmp_path / "rules.json")
+    library = RuleLibrary.load(path)
+    assert library.add(BILLED) == "rule-1"
+    library.save()
+    reloaded = RuleLibrary.load(path)
+    assert reloaded.add(BILLED) == "rule-1"
+    assert reloaded.match("level: INFO") == []
+    reloaded.add(LEVEL)
+    assert [rule_id for rule_id, _ in reloaded.match("level: INFO")] == ["rule-2"]
+
+def test_automaton_finds_patterns_added_between_searches():
+    automaton = AhoCorasick(["bc"])
+    assert automaton.search("abc") == {"bc"}
+    for idx in range(200):
+        automaton.add(f"abd{idx};")
+        assert automaton.search(f"abc abd{idx};") == {"bc", f"abd{idx};"}
+    assert len(automaton) == 201
+
+def test_cli_skips_library_for_rules_the_evaluator_cannot_read(tmp_path, monkeypatch, capsys):
+    sample = tmp_path / "sample.json"
+    sample.write_text(json.dumps({"content": "level INFO"}))
+    library = tmp_path / "lib.json"
+    monkeypatch.setattr(sys, "argv", [
+        "dynatrace-dpl-helper", "-f", str(sample), "-a", "lvl",
+        "--custom", "ENUM{'INFO'=1}:lvl", "--library", str(library),
+    ])
+    cli.main()
+    out, err = capsys.readouterr()
+    assert out.startswith("PARSE(content, ")
+    assert "not checked or updated" in err
+    assert not library.exists()
+
+def test_unreadable_stored_rules_are_skipped_and_kept(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps({"version": 1, "rules": [
+        {"id": "rule-1", "rule": 'PARSE(content, "ENUM{\'INFO\'=1}:lvl")'},
+        {"id": "rule-2", "rule": BILLED},
+    ]}))
+    library = RuleLibrary.load(str(path))
+    assert list(library.rules) == ["rule-2"] and list(library.skipped) == ["rule-1"]
+    assert "rule rule-1 skipped" in capsys.readouterr().err
+
+    sample = tmp_path / "sample.json"
+    sample.write_text(json.dumps({"content": "level: INFO"}))
+    monkeypatch.setattr(sys, "argv", [
+        "dynatrace-dpl-helper", "-f", str(sample), "-l", "level:", "-v", "INFO", "-a", "level",
+        "--library", str(path),
+    ])
+    cli.main()
+    stored = [entry["id"] for entry in json.loads(path.read_text())["rules"]]
+    assert stored == ["rule-2", "rule-3", "rule-1"]
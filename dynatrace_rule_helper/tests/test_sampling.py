@@ -0,0 +1,41 @@
+# Dynatrace Rule Helper – stratified sampling tests
+
+from dynatrace_rule_helper.engine.sampling import OVERFLOW_SHAPE, StratifiedSampler, sample_log_lines
+from dynatrace_rule_helper.utils.shape import line_shape
+
+def test_line_shape_ignores_values():
+    assert line_shape("2024-01-01 12:00:03 INFO took 15 ms") == line_shape("2023-12-31 09:15:59 INFO took 7 ms")
+    assert line_shape("GET /a?x=1") != line_shape("user=bob")
+
+def test_line_shape_keeps_level_words():
+    info = line_shape("2024-01-01 12:00:03 INFO User alice logged in")
+    assert info == line_shape("2024-01-01 12:00:09 INFO User bob logged in")
+    assert info != line_shape("2024-01-01 12:00:04 ERROR Disk full on node7")
+
+def test_syslog_month_does_not_split_shapes():
+    jan = line_shape("Jan 31 23:59:59 host sshd[42]: Accepted publickey for alice")
+    assert jan == line_shape("Feb  1 00:00:01 host sshd[7]: Accepted publickey for bob")
+    assert jan != line_shape("Feb  1 00:00:01 host sshd[7]: [WARN] Accepted publickey for bob")
+
+def test_rare_variant_is_sampled_after_common_case():
+    lines = [f"INFO request id={i} took {i % 90} ms" for i in range(10_000)]
+    lines.insert(5_000, "ERROR failed: java.lang.NullPointerException at Foo.bar(Foo.java:42)")
+    samples = sample_log_lines(lines, total=2, seed=7)
+    assert samples[0].content.startswith("INFO") and samples[0].stratum_count == 10_000
+    assert samples[1].content.startswith("ERROR") and samples[1].stratum_count == 1
+    assert samples[1].to_record()["content"] == lines[5_000]
+
+def test_memory_is_bounded_by_strata_and_reservoirs():
+    sampler = StratifiedSampler(per_stratum=2, max_strata=3, seed=1)
+    sampler.add_many("x" + "." * i for i in range(100))
+    assert len(sampler.strata) == 3
+    assert sampler.strata[OVERFLOW_SHAPE].count == 98
+    assert sum(len(s.reservoir) for s in sampler.strata.values()) <= 2 * 3
+    assert all(len(s.reservoir) <= 2 for s in sampler.strata.values())
+
+def test_few_strata_fill_the_requested_total():
+    lines = [f"2024-01-01 12:00:03 INFO User u{i} logged in" for i in range(100_000)]
+    lines += [f"2024-01-01 12:00:04 ERROR Disk full on node{i}" for i in range(3)]
+    samples = sample_log_lines(lines, total=10, seed=3)
+    assert len(samples) == 10
+    assert sum(sample.content.startswith("2024-01-01 12:00:04 ERROR") for sample in samples) == 3
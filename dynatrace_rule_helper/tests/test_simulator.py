@@ -0,0 +1,28 @@
+# Dynatrace Rule Helper – pipeline simulator tests
+
+from dynatrace_rule_helper.engine.rule_library import RuleLibrary
+from dynatrace_rule_helper.engine.simulator import load_rule_set, simulate
+
+RULES = [
+    "PARSE(content, \"LD 'Billed Duration:' SPACE? INT:aws.billed.duration\")",
+    "PARSE(content, \"LD 'JobName:' SPACE? STRING:job\")",
+    "PARSE(content, \"UPPER:first\")",
+]
+
+def test_simulation_counts_only_prefiltered_evaluations():
+    library = RuleLibrary.from_rules(RULES)
+    lines = ["Billed Duration: 5034 ms", "Billed Duration: n/a", "JobName: A1", "nothing here"]
+    report = simulate(library, lines)
+    assert report.lines == 4
+    billed, job, upper = (report.rules[rule_id] for rule_id in ("rule-1", "rule-2", "rule-3"))
+    assert (billed.evaluations, billed.matches) == (2, 1)
+    assert (job.evaluations, job.matches) == (1, 1)
+    # The unanchored rule cannot be prefiltered and is evaluated for every line
+    assert upper.evaluations == 4
+    assert report.prefilter_savings == 1 - 7 / 12
+    assert "lines/s" in report.format()
+
+def test_load_rule_set_from_text_file(tmp_path):
+    path = tmp_path / "rules.txt"
+    path.write_text("# generated rules\n" + "\n".join(RULES) + "\n\n")
+    assert len(load_rule_set(str(path))) == 3
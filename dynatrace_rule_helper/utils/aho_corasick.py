@@ -0,0 +1,95 @@
+"""Aho–Corasick automaton for finding many literal strings in one pass.
+
+Used as a prefilter: instead of testing thousands of rule literals one by one,
+each log line is scanned once and every literal it contains is reported.
+Patterns can be added at any time.  New patterns wait in a short pending list
+that searches check with plain ``in`` tests; they are merged into the trie –
+with one rebuild of the failure links – only once the list outgrows a
+threshold proportional to the automaton's size.  Alternating additions and
+searches therefore cost amortised linear rebuild time, not a rebuild per add.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+PENDING_MIN = 16        # pending patterns always tolerated before a rebuild
+PENDING_MAX = 256       # upper bound on ``in`` tests per search
+
+class AhoCorasick:
+    """Multi‑pattern literal matcher over a growing set of patterns."""
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._terminal: List[Optional[str]] = [None]   # pattern ending in each state
+        self._out: List[Tuple[str, ...]] = [()]
+        self._patterns: Set[str] = set()
+        # Added but not yet in the trie – inserting them without rebuilding the
+        # failure links would make searches miss patterns already in the trie
+        self._pending: List[str] = []
+        for pattern in patterns:
+            self.add(pattern)
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def add(self, pattern: str) -> None:
+        """Add *pattern* (empty strings are ignored)."""
+        if not pattern or pattern in self._patterns:
+            return
+        self._patterns.add(pattern)
+        self._pending.append(pattern)
+
+    def _insert(self, pattern: str) -> None:
+        goto = self._goto
+        state = 0
+        for ch in pattern:
+            nxt = goto[state].get(ch)
+            if nxt is None:
+                nxt = len(goto)
+                goto.append({})
+                self._fail.append(0)
+                self._terminal.append(None)
+                self._out.append(())
+                goto[state][ch] = nxt
+            state = nxt
+        self._terminal[state] = pattern
+
+    def _build(self) -> None:
+        """Insert the pending patterns and recompute failure links and outputs."""
+        for pattern in self._pending:
+            self._insert(pattern)
+        self._pending = []
+        goto, fail, terminal, out = self._goto, self._fail, self._terminal, self._out
+        queue = deque()
+        for child in goto[0].values():
+            fail[child] = 0
+            out[child] = (terminal[child],) if terminal[child] else ()
+            queue.append(child)
+        while queue:
+            state = queue.popleft()
+            for ch, child in goto[state].items():
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(ch, 0)
+                own = (terminal[child],) if terminal[child] else ()
+                out[child] = own + out[fail[child]]
+                queue.append(child)
+
+    def search(self, text: str) -> Set[str]:
+        """Return the set of patterns that occur anywhere in *text*."""
+        pending = self._pending
+        if len(pending) > min(PENDING_MAX, max(PENDING_MIN, len(self._patterns) // 8)):
+            self._build()
+            pending = self._pending
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[str] = {pattern for pattern in pending if pattern in text}
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
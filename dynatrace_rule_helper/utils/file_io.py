@@ -2,7 +2,10 @@
 """
 
 import json
+import sys
+import time
 from pathlib import Path
+from typing import Callable, Iterator, Optional
 
 def read_json(file_path: str) -> dict:
     """Read a JSON file using UTF‑8‑BOM handling.
@@ -13,3 +16,54 @@ def read_json(file_path: str) -> dict:
             return json.load(f)
     except Exception as exc:
         raise Exception(f"Failed to read JSON file '{file_path}': {exc}")
+
+def iter_log_lines(file_path: str, follow: bool = False,
+                   on_idle: Optional[Callable[[], None]] = None) -> Iterator[str]:
+    """Stream the log lines of a corpus file one at a time.
+
+    Each line may either be a JSON record with a ``content`` field (as exported
+    from Dynatrace) or raw log text.  ``-`` reads from stdin.  Blank lines are
+    skipped; the file is never loaded into memory as a whole.  With *follow*
+    the function keeps waiting for lines appended to the file, like ``tail -f``,
+    and calls *on_idle* (if given) every time it polls without new data.
+    """
+    if file_path == "-":
+        handle = sys.stdin
+    else:
+        try:
+            handle = open(file_path, "r", encoding="utf-8-sig", errors="replace", buffering=1 << 20)
+        except Exception as exc:
+            raise Exception(f"Failed to open log file '{file_path}': {exc}")
+    try:
+        for raw in _follow(handle, on_idle=on_idle) if follow else handle:
+            line = raw.rstrip("\r\n")
+            if not line:
+                continue
+            if line[0] == "{":
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                if isinstance(record, dict) and isinstance(record.get("content"), str):
+                    line = record["content"]
+            yield line
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+def _follow(handle, poll_interval: float = 0.5,
+            on_idle: Optional[Callable[[], None]] = None) -> Iterator[str]:
+    """Yield lines from *handle*, polling for new data at end of file."""
+    pending = ""
+    while True:
+        chunk = handle.readline()
+        if not chunk:
+            if on_idle is not None:
+                on_idle()
+            time.sleep(poll_interval)
+            continue
+        pending += chunk
+        # Only hand out complete lines – the writer may be mid‑line
+        if pending.endswith("\n"):
+            yield pending
+            pending = ""
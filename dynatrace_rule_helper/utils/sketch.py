@@ -0,0 +1,79 @@
+"""Fixed‑size frequency sketches used when streaming large log corpora.
+
+Both structures keep a bounded amount of memory no matter how many items are
+fed into them, so a multi‑GB corpus can be scanned without holding its values.
+
+* ``CountMinSketch`` – approximate frequency of any item (never underestimates).
+* ``SpaceSaving``    – the *k* most frequent items (heavy hitters) with counts.
+"""
+
+from array import array
+from typing import Dict, Hashable, List, Tuple
+
+class CountMinSketch:
+    """Count‑Min sketch with ``depth`` rows of ``width`` counters.
+
+    The estimate for an item is the minimum of its counters, so collisions can
+    only inflate it.  With the defaults the overestimate is at most
+    ``total / 1024`` for ~98 % of the queries.
+    """
+
+    def __init__(self, width: int = 2048, depth: int = 4):
+        if width < 1 or depth < 1:
+            raise ValueError("CountMinSketch width and depth must be positive.")
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self._rows = [array("q", bytes(8 * width)) for _ in range(depth)]
+
+    def _indexes(self, item: Hashable):
+        width = self.width
+        return [hash((seed, item)) % width for seed in range(self.depth)]
+
+    def add(self, item: Hashable, count: int = 1) -> None:
+        self.total += count
+        for row, idx in zip(self._rows, self._indexes(item)):
+            row[idx] += count
+
+    def estimate(self, item: Hashable) -> int:
+        return min(row[idx] for row, idx in zip(self._rows, self._indexes(item)))
+
+    def clear(self) -> None:
+        self.total = 0
+        self._rows = [array("q", bytes(8 * self.width)) for _ in range(self.depth)]
+
+class SpaceSaving:
+    """Space‑Saving heavy‑hitters summary tracking at most ``capacity`` items.
+
+    When the summary is full the least frequent entry is evicted and the new
+    item inherits its count, so reported counts are upper bounds.  Any item
+    that occurs more than ``total / capacity`` times is guaranteed to be kept.
+    """
+
+    def __init__(self, capacity: int = 64):
+        if capacity < 1:
+            raise ValueError("SpaceSaving capacity must be positive.")
+        self.capacity = capacity
+        self.total = 0
+        self.evictions = 0
+        self._counts: Dict[Hashable, int] = {}
+
+    def add(self, item: Hashable, count: int = 1) -> None:
+        self.total += count
+        counts = self._counts
+        if item in counts:
+            counts[item] += count
+        elif len(counts) < self.capacity:
+            counts[item] = count
+        else:
+            victim = min(counts, key=counts.__getitem__)
+            counts[item] = counts.pop(victim) + count
+            self.evictions += 1
+
+    def top(self, k: int = None) -> List[Tuple[Hashable, int]]:
+        """Return up to *k* ``(item, count)`` pairs, most frequent first."""
+        ranked = sorted(self._counts.items(), key=lambda kv: (-kv[1], str(kv[0])))
+        return ranked if k is None else ranked[:k]
+
+    def __len__(self) -> int:
+        return len(self._counts)
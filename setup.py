@@ -13,9 +13,13 @@ setup(
     packages=find_packages(),
     python_requires=">=3.8",
     install_requires=[],
+    extras_require={"fast": ["numpy"]},
     entry_points={
         "console_scripts": [
-            "dynatrace-dpl-helper=dynatrace_rule_helper.cli:main"
+            "dynatrace-dpl-helper=dynatrace_rule_helper.cli:main",
+            "dynatrace-dpl-simulate=dynatrace_rule_helper.simulate:main",
+            "dynatrace-dpl-sample=dynatrace_rule_helper.sample:main",
+            "dynatrace-dpl-drift=dynatrace_rule_helper.drift:main",
         ]
     },
     license="MIT",